@@ -1,3 +1,4 @@
+import functools
 import io
 import re
 import time
@@ -5,7 +6,6 @@ from datetime import datetime, timedelta
 
 import mysql.connector
 import pandas as pd
-import plotly.express as px
 import streamlit as st
 from werkzeug.security import check_password_hash
 
@@ -34,7 +34,9 @@ def check_user(username, password):
 
 
 # === ARTICLES BDD ===
-def insert_article_in_db(article_data, status, user):
+@st.cache_resource(show_spinner=False)
+def ensure_articles_schema():
+    """Ajoute les colonnes manquantes à articles_tri (une fois par processus)."""
     conn = get_connection()
     cursor = conn.cursor()
 
@@ -68,6 +70,17 @@ def insert_article_in_db(article_data, status, user):
     except Exception as e:
         print(f"Erreur lors de l'ajout des colonnes: {e}")
 
+    cursor.close()
+    conn.close()
+    return True
+
+
+def insert_article_in_db(article_data, status, user):
+    ensure_articles_schema()
+
+    conn = get_connection()
+    cursor = conn.cursor()
+
     # Insérer l'article avec toutes les colonnes
     sql = """
     INSERT INTO articles_tri 
@@ -105,10 +118,16 @@ def insert_article_in_db(article_data, status, user):
     conn.commit()
     cursor.close()
     conn.close()
+    fetch_articles_from_db.clear()
 
 
+@st.cache_data(ttl=300, show_spinner=False)
 def fetch_articles_from_db(user=None):
-    """Récupère les articles de la base, filtrés par utilisateur si fourni."""
+    """Récupère les articles de la base, filtrés par utilisateur si fourni.
+
+    Le résultat est mis en cache entre les reruns ; toute écriture en base
+    invalide le cache via fetch_articles_from_db.clear().
+    """
     conn = get_connection()
     cursor = conn.cursor(dictionary=True)
     if user:
@@ -132,6 +151,7 @@ def delete_article_from_db(article_id):
     conn.commit()
     cursor.close()
     conn.close()
+    fetch_articles_from_db.clear()
 
 
 def update_article_in_db(article_id, updated_data):
@@ -164,59 +184,129 @@ def update_article_in_db(article_id, updated_data):
     conn.commit()
     cursor.close()
     conn.close()
+    fetch_articles_from_db.clear()
 
 
 # === UTILITAIRES ===
+# Alias d'en-têtes reconnus pour chaque champ de la base
+COLUMN_ALIASES = {
+    "title": [
+        "title",
+        "article title",
+        "titre",
+        "nom",
+        "article",
+        "name",
+        "article public author title",
+    ],
+    "authors": ["authors", "auteurs", "author"],
+    "journal": ["journal name", "journal", "revue", "publication"],
+    "year": ["publication year", "year", "année", "annee", "date"],
+    "abstract": ["abstract", "abstract note", "résumé", "resume", "description"],
+    "doi": ["doi"],
+    "url": ["url", "link"],
+    "issn": ["issn"],
+    "abs_lo_uo": ["abs lo uo", "abs_lo_uo", "abslouo"],
+    "notes": ["notes", "note"],
+    "type_revue": ["type revue", "type_revue", "typerevue"],
+    "wl_mesure": ["wl = mesure", "wl_mesure", "wlmesure"],
+    "chir_participants": [
+        "chir = participants",
+        "chir_participants",
+        "chirparticipants",
+    ],
+    "specialiste": ["specialiste", "spécialiste"],
+    "intervention": ["intervention"],
+    "technique": ["technique"],
+    "contexte": ["contexte", "context"],
+    "simulation": ["simulation"],
+    "additional_outcomes": [
+        "additional outcomes / exclusion",
+        "additional_outcomes",
+        "additionaloutcomes",
+    ],
+}
+# En-têtes utiles : les autres colonnes du fichier ne sont pas chargées
+KNOWN_HEADERS = frozenset(
+    opt.lower() for options in COLUMN_ALIASES.values() for opt in options
+)
+
+
 def smart_column_mapping(df):
-    mappings = {
-        "title": [
-            "title",
-            "article title",
-            "titre",
-            "nom",
-            "article",
-            "name",
-            "article public author title",
-        ],
-        "authors": ["authors", "auteurs", "author"],
-        "journal": ["journal name", "journal", "revue", "publication"],
-        "year": ["publication year", "year", "année", "annee", "date"],
-        "abstract": ["abstract", "abstract note", "résumé", "resume", "description"],
-        "doi": ["doi"],
-        "url": ["url", "link"],
-        "issn": ["issn"],
-        "abs_lo_uo": ["abs lo uo", "abs_lo_uo", "abslouo"],
-        "notes": ["notes", "note"],
-        "type_revue": ["type revue", "type_revue", "typerevue"],
-        "wl_mesure": ["wl = mesure", "wl_mesure", "wlmesure"],
-        "chir_participants": [
-            "chir = participants",
-            "chir_participants",
-            "chirparticipants",
-        ],
-        "specialiste": ["specialiste", "spécialiste"],
-        "intervention": ["intervention"],
-        "technique": ["technique"],
-        "contexte": ["contexte", "context"],
-        "simulation": ["simulation"],
-        "additional_outcomes": [
-            "additional outcomes / exclusion",
-            "additional_outcomes",
-            "additionaloutcomes",
-        ],
-    }
     available_cols = df.columns.tolist()
-    available_lower = [c.lower().strip() for c in available_cols]
+    # Le mapping ne dépend que des en-têtes : on le mémorise par jeu de colonnes
+    cache = st.session_state.setdefault("_column_mapping_cache", {})
+    cache_key = tuple(available_cols)
+    if cache_key in cache:
+        return cache[cache_key]
+    available_lower = [str(c).lower().strip() for c in available_cols]
     final_mapping = {}
-    for target, options in mappings.items():
+    for target, options in COLUMN_ALIASES.items():
         for opt in options:
             if opt.lower() in available_lower:
                 idx = available_lower.index(opt.lower())
                 final_mapping[target] = available_cols[idx]
                 break
+    cache[cache_key] = final_mapping
     return final_mapping
 
 
+def _store_df(key, df):
+    """Stocke un DataFrame en session sous forme de blob parquet compressé."""
+    try:
+        st.session_state[key] = df.to_parquet(compression="zstd")
+    except Exception:
+        # Colonnes non sérialisables en parquet : on garde l'objet tel quel
+        st.session_state[key] = df
+
+
+def _load_df(key):
+    """Recharge un DataFrame stocké par _store_df (None si absent)."""
+    value = st.session_state.get(key)
+    if isinstance(value, bytes):
+        return pd.read_parquet(io.BytesIO(value))
+    return value
+
+
+@st.cache_data(persist="disk", show_spinner=False)
+def load_excel(file_bytes):
+    """Lit un fichier Excel importé ; cache disque indexé sur le contenu du fichier."""
+    # Seules les colonnes reconnues par smart_column_mapping sont lues
+    df = pd.read_excel(
+        io.BytesIO(file_bytes),
+        engine="openpyxl",
+        usecols=lambda col: str(col).lower().strip() in KNOWN_HEADERS,
+    )
+    # Aucun en-tête reconnu : on relit tout le classeur plutôt que de perdre
+    # les lignes (elles s'affichent alors avec les valeurs par défaut)
+    if len(df.columns) == 0:
+        df = pd.read_excel(io.BytesIO(file_bytes), engine="openpyxl")
+    # Stockage Arrow : sérialisation sans conversion objet → Arrow à chaque rerun
+    return df.convert_dtypes(dtype_backend="pyarrow")
+
+
+def record_vote(df, idx, article_data, status):
+    """
+    Callback des boutons de vote : exécuté avant le rerun déclenché par le clic,
+    ce qui évite un second passage complet du script via st.rerun()
+    """
+    df.at[idx, "vote_status"] = status
+    _store_df("excel_data", df)
+    insert_article_in_db(article_data, status, st.session_state["username"])
+    # L'article voté sort de la liste : le suivant prend sa place,
+    # l'index de tri courant reste donc inchangé
+
+
+def triage_progress(total, pending_count):
+    """
+    Position de l'article courant et avancement du tri. Les articles votés
+    sortent de la liste des articles en attente : l'avancement se déduit donc
+    du nombre de votes déjà exprimés, et non de l'index de tri
+    """
+    position = total - pending_count + 1
+    return position, position / total
+
+
 def get_article_field(article, field_name, mapping, default=""):
     if field_name in mapping and mapping[field_name] in article:
         value = article[mapping[field_name]]
@@ -242,29 +332,40 @@ def highlight_text(text, keywords):
     # Convertir en string au cas où ce serait autre chose
     text = str(text)
 
-    for word in keywords:
-        if word.strip():
-            # Échapper les caractères spéciaux pour la regex
-            escaped_word = re.escape(word.strip())
-            regex = re.compile(rf"({escaped_word})", re.IGNORECASE)
-            # Utiliser des guillemets doubles et échapper le contenu HTML
-            text = regex.sub(
-                lambda m: f'<span style="background-color:#00e1c6;color:#000;font-weight:600;border-radius:4px;padding:2px 4px;display:inline-block;">{m.group(1)}</span>',
-                text,
-            )
-    return text
+    regex = _keywords_regex(tuple(keywords))
+    if regex is None:
+        return text
+    # Utiliser des guillemets doubles et échapper le contenu HTML
+    return regex.sub(
+        lambda m: f'<span style="background-color:#00e1c6;color:#000;font-weight:600;border-radius:4px;padding:2px 4px;display:inline-block;">{m.group(1)}</span>',
+        text,
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _keywords_regex(keywords):
+    """Compile une seule regex d'alternance par jeu de mots-clés (mise en cache)."""
+    words = {word.strip() for word in keywords if word.strip()}
+    if not words:
+        return None
+    # Échapper les caractères spéciaux ; les mots les plus longs d'abord
+    pattern = "|".join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+    return re.compile(rf"({pattern})", re.IGNORECASE)
 
 
 # === COLONNES D'AFFICHAGE ===
+@st.cache_data(show_spinner=False)
 def format_display_columns(df):
     """
     Formate le DataFrame avec les colonnes demandées pour l'affichage et l'export
+    (mis en cache : un tableau inchangé n'est pas reformaté à chaque rerun)
     """
-    display_df = pd.DataFrame()
+    # Construction colonne par colonne dans un dict, puis un seul DataFrame
+    columns = {}
 
     # Ajouter l'ID en première colonne si disponible
     if "id" in df.columns:
-        display_df["ID"] = df["id"]
+        columns["ID"] = df["id"]
 
     # Mapping des colonnes selon l'image fournie
     column_mapping = {
@@ -294,19 +395,79 @@ def format_display_columns(df):
     # Créer le DataFrame d'affichage avec les colonnes dans l'ordre souhaité
     for display_col, source_col in column_mapping.items():
         if source_col and source_col in df.columns:
-            display_df[display_col] = df[source_col]
+            columns[display_col] = df[source_col]
         else:
             # Ajouter une colonne vide si la colonne n'existe pas
-            display_df[display_col] = ""
+            columns[display_col] = ""
 
     # Préserver l'index original pour la correspondance
-    display_df.index = df.index
+    return pd.DataFrame(columns, index=df.index)
+
 
-    return display_df
+PAGE_SIZE = 50
+
+# Champs affichés dans la carte de tri
+CARD_FIELDS = ("title", "authors", "journal", "year", "doi", "url", "abstract")
+
+
+def _reset_widget_state(key):
+    """Oublie l'état d'un widget (callback on_change)."""
+    st.session_state.pop(key, None)
+
+
+def paginate_dataframe(df, key, editor_key=None):
+    """
+    Retourne la page courante du DataFrame (PAGE_SIZE lignes) et son numéro,
+    pour ne pas sérialiser tout le tableau à chaque rerun.
+    Si editor_key est fourni, les éditions en cours de ce data_editor sont
+    réinitialisées au changement de page : l'éditeur garde une clé stable
+    au lieu d'une clé par page qui accumulait des états obsolètes.
+    """
+    n_pages = max((len(df) - 1) // PAGE_SIZE + 1, 1)
+    if n_pages == 1:
+        return df, 1
+    page = st.number_input(
+        f"Page (1-{n_pages})", min_value=1, max_value=n_pages, value=1, key=key,
+        on_change=_reset_widget_state if editor_key else None,
+        args=(editor_key,) if editor_key else None,
+    )
+    start = (page - 1) * PAGE_SIZE
+    return df.iloc[start : start + PAGE_SIZE].copy(), page
+
+
+@st.cache_data(show_spinner=False)
+def split_by_status(df_db):
+    """Sépare les articles par statut (conservés, rejetés, mis de côté) en une passe."""
+    groups = dict(tuple(df_db.groupby("status", sort=False)))
+    empty = df_db.iloc[0:0]
+    return (
+        groups.get("accept", empty),
+        groups.get("reject", empty),
+        groups.get("aside", empty),
+    )
+
+
+# === STATISTIQUES ===
+@st.cache_data(show_spinner=False)
+def prepare_stats_data(df_db):
+    """Prépare les colonnes dérivées (dates, heures) utilisées par les graphiques."""
+    df_stats = df_db.copy()
+
+    # Convertir date_action en datetime si ce n'est pas déjà fait
+    if "date_action" in df_stats.columns:
+        df_stats["date_action"] = pd.to_datetime(df_stats["date_action"])
+        df_stats["date_only"] = df_stats["date_action"].dt.date
+        df_stats["hour"] = df_stats["date_action"].dt.hour
+        df_stats["day_name"] = df_stats["date_action"].dt.day_name()
+    return df_stats
 
 
 # === EXPORT ===
-def export_excel(sub_df, filename):
+@st.cache_data(show_spinner=False)
+def build_excel_bytes(sub_df):
+    """Construit le classeur d'export en mémoire (mis en cache par contenu)."""
+    from openpyxl.utils import get_column_letter
+
     # Formater les colonnes pour l'export
     formatted_df = format_display_columns(sub_df)
 
@@ -314,22 +475,21 @@ def export_excel(sub_df, filename):
     with pd.ExcelWriter(output, engine="openpyxl") as writer:
         formatted_df.to_excel(writer, index=False, sheet_name="Articles")
         worksheet = writer.sheets["Articles"]
-        for col_cells in worksheet.columns:
-            max_length = 0
-            col = col_cells[0].column_letter
-            for cell in col_cells:
-                try:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                except:
-                    pass
-            worksheet.column_dimensions[col].width = min(
+        # Largeurs calculées sur les colonnes pandas (.str.len vectorisé)
+        # plutôt qu'en parcourant chaque cellule openpyxl
+        for col_idx, col_name in enumerate(formatted_df.columns, start=1):
+            lengths = formatted_df[col_name].dropna().astype(str).str.len()
+            max_length = max(len(str(col_name)), int(lengths.max()) if len(lengths) else 0)
+            worksheet.column_dimensions[get_column_letter(col_idx)].width = min(
                 max_length + 2, 50,
             )  # Limiter la largeur max à 50
-    output.seek(0)
+    return output.getvalue()
+
+
+def export_excel(sub_df, filename):
     st.download_button(
         f"⬇️ Exporter {filename}",
-        output.getvalue(),
+        build_excel_bytes(sub_df),
         file_name=f"{filename}.xlsx",
         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     )
@@ -800,6 +960,8 @@ def logout_user():
         del st.session_state["triage_index"]
     if "excel_data" in st.session_state:
         del st.session_state["excel_data"]
+    st.session_state.pop("_excel_records", None)
+    st.session_state.pop("excel_file_id", None)
 
 
 # Initialiser la session
@@ -898,17 +1060,27 @@ df_db = fetch_articles_from_db(st.session_state["username"])
 uploaded_file = st.file_uploader(
     "📂 Importez un fichier Excel (optionnel)", type=["xlsx", "xlsm"],
 )
-if uploaded_file:
-    df = pd.read_excel(uploaded_file, engine="openpyxl")
+# Ne traiter le fichier qu'une fois par import : sinon chaque rerun
+# relisait le classeur et remettait tous les votes à "pending"
+if uploaded_file and st.session_state.get("excel_file_id") != uploaded_file.file_id:
+    df = load_excel(uploaded_file.getvalue())
+    if not smart_column_mapping(df):
+        expected = ", ".join(
+            COLUMN_ALIASES[target][0] for target in ("title", "authors", "journal", "year", "abstract")
+        )
+        st.warning(f"⚠️ Aucun en-tête reconnu dans le fichier (attendus : {expected}, ...)")
     df["vote_status"] = "pending"
-    st.session_state["excel_data"] = df
+    _store_df("excel_data", df)
+    st.session_state.pop("_excel_records", None)
+    st.session_state["excel_file_id"] = uploaded_file.file_id
 else:
-    df = st.session_state.get("excel_data", None)
+    df = _load_df("excel_data")
 
 # Tri interactif si Excel chargé
-if df is not None and len(df[df["vote_status"] == "pending"]) > 0:
+# Masque calculé une seule fois ; on ne garde que les index, sans copier les lignes
+pending = df.index[df["vote_status"] == "pending"] if df is not None else []
+if len(pending) > 0:
     column_mapping = smart_column_mapping(df)
-    pending = df[df["vote_status"] == "pending"].reset_index()
 
     # Navigation et mots-clés
     col_nav1, col_nav2 = st.columns([2, 1])
@@ -939,9 +1111,13 @@ if df is not None and len(df[df["vote_status"] == "pending"]) > 0:
     if cur >= len(pending):
         cur = 0
         st.session_state["triage_index"] = 0
-    row = pending.iloc[cur]
-    idx = int(row["index"])
-    current_article = df.loc[idx]
+    idx = int(pending[cur])
+    # Lignes converties une fois en dicts : accès O(1) sans recréer une Series
+    records = st.session_state.get("_excel_records")
+    if records is None or len(records) != len(df):
+        records = df.to_dict(orient="index")
+        st.session_state["_excel_records"] = records
+    current_article = records[idx]
 
     art_data = {
         "title": get_article_field(
@@ -995,13 +1171,20 @@ if df is not None and len(df[df["vote_status"] == "pending"]) > 0:
         ),
     }
 
-    display_data = {k: highlight_text(v, keywords) for k, v in art_data.items()}
+    # Seuls les champs affichés dans la carte sont surlignés
+    display_data = {k: highlight_text(art_data[k], keywords) for k in CARD_FIELDS}
+    # Lien construit une fois, sur l'URL brute (le surlignage casserait le href)
+    url_html = (
+        f'<div class="meta-item"><div class="meta-label">🌍 URL</div><div class="meta-value"><a href="{art_data["url"]}" target="_blank">{display_data["url"]}</a></div></div>'
+        if art_data["url"]
+        else ""
+    )
 
     # Affichage de la progression
-    progress_pct = (cur + 1) / len(df)
-    st.markdown(f"### Article {cur+1}/{len(df)}")
+    position, progress_pct = triage_progress(len(df), len(pending))
+    st.markdown(f"### Article {position}/{len(df)}")
     st.progress(
-        progress_pct, text=f"Progression du tri: {cur+1}/{len(df)} ({progress_pct:.1%})",
+        progress_pct, text=f"Progression du tri: {position}/{len(df)} ({progress_pct:.1%})",
     )
 
     st.markdown(
@@ -1012,7 +1195,7 @@ if df is not None and len(df[df["vote_status"] == "pending"]) > 0:
       <div class="meta-item"><div class="meta-label">📚 Journal</div><div class="meta-value">{display_data['journal']}</div></div>
       <div class="meta-item"><div class="meta-label">📅 Année</div><div class="meta-value">{display_data['year']}</div></div>
       <div class="meta-item"><div class="meta-label">🔗 DOI</div><div class="meta-value">{display_data['doi']}</div></div>
-      {f'<div class="meta-item"><div class="meta-label">🌍 URL</div><div class="meta-value"><a href="{display_data["url"]}" target="_blank">{display_data["url"]}</a></div></div>' if display_data["url"] else ""}
+      {url_html}
       <div class="abstract-section"><strong>📝 Résumé</strong><br><br>{display_data['abstract']}</div>
     </div>
     """,
@@ -1020,231 +1203,238 @@ if df is not None and len(df[df["vote_status"] == "pending"]) > 0:
     )
 
     col1, col2, col3 = st.columns(3)
+    vote_args = (df, idx, art_data)
     with col1:
-        if st.button("🗑️ REJETER"):
-            df.at[idx, "vote_status"] = "reject"
-            insert_article_in_db(art_data, "reject", st.session_state["username"])
-            st.session_state["triage_index"] = cur + 1
-            st.rerun()
+        st.button("🗑️ REJETER", on_click=record_vote, args=(*vote_args, "reject"))
     with col2:
-        if st.button("⏸️ METTRE DE CÔTÉ"):
-            df.at[idx, "vote_status"] = "aside"
-            insert_article_in_db(art_data, "aside", st.session_state["username"])
-            st.session_state["triage_index"] = cur + 1
-            st.rerun()
+        st.button(
+            "⏸️ METTRE DE CÔTÉ", on_click=record_vote, args=(*vote_args, "aside"),
+        )
     with col3:
-        if st.button("✅ GARDER"):
-            df.at[idx, "vote_status"] = "accept"
-            insert_article_in_db(art_data, "accept", st.session_state["username"])
-            st.session_state["triage_index"] = cur + 1
-            st.rerun()
+        st.button("✅ GARDER", on_click=record_vote, args=(*vote_args, "accept"))
 
 # Toujours afficher les résultats depuis la BDD
-st.subheader("📊 Résultats enregistrés en base")
+# Fragment : les interactions avec les tableaux (pagination, édition)
+# ne relancent que cette section, pas tout le script
+@st.fragment
+def results_section():
+    # Relecture (en cache) pour refléter les écritures faites dans le fragment
+    df_db = fetch_articles_from_db(st.session_state["username"])
+
+    st.subheader("📊 Résultats enregistrés en base")
+
+    if not df_db.empty:
+        kept, rejected, aside = split_by_status(df_db)
+
+        # Fonction pour gérer les modifications et suppressions d'un tableau
+        def handle_table_actions(edited_df, original_df, status_name):
+            # Suppressions
+            delete_col = "🗑️ Supprimer"
+            if delete_col in edited_df.columns:
+                to_delete = edited_df[edited_df[delete_col]]
+                for _, row in to_delete.iterrows():
+                    if "ID" in row:
+                        delete_article_from_db(row["ID"])
+                        st.toast(f"🗑️ Article ID {row['ID']} supprimé", icon="🗑️")
+                if not to_delete.empty:
+                    st.rerun()
+
+            # Retirer la colonne de suppression pour la comparaison
+            if delete_col in edited_df.columns:
+                edited_df = edited_df.drop(columns=[delete_col])
+                original_df = original_df.drop(columns=[delete_col])
+
+            if not edited_df.equals(original_df):
+                st.success(f"📝 Modifications détectées dans {status_name}")
+
+                # Comparer ligne par ligne pour identifier les changements
+                for idx in range(len(edited_df)):
+                    if idx < len(original_df):
+                        original_row = original_df.iloc[idx]
+                        edited_row = edited_df.iloc[idx]
+
+                        # Si c'est une ligne modifiée
+                        if not edited_row.equals(original_row):
+                            # Récupérer l'ID directement depuis la colonne ID du tableau édité
+                            if "ID" in edited_df.columns:
+                                article_id = edited_row["ID"]
+                            else:
+                                st.error("Impossible de trouver l'ID de l'article")
+                                continue
+
+                            # Préparer les données à mettre à jour (mapping inverse)
+                            update_data = {}
+                            column_mapping_reverse = {
+                                "Article Public Author Title": "title",
+                                "Journal": "journal",
+                                "ISSN": "issn",
+                                "DOI": "doi",
+                                "URL": "url",
+                                "Abstract Note": "abstract",
+                                "ABS LO UO": "abs_lo_uo",
+                                "Notes": "notes",
+                                "Type revue": "type_revue",
+                                "WL = mesure": "wl_mesure",
+                                "Chir = participants": "chir_participants",
+                                "Specialiste": "specialiste",
+                                "Intervention": "intervention",
+                                "Technique": "technique",
+                                "Contexte": "contexte",
+                                "Simulation": "simulation",
+                                "additional outcomes / exclusion": "additional_outcomes",
+                            }
+
+                            for display_col, db_col in column_mapping_reverse.items():
+                                if display_col in edited_df.columns:
+                                    update_data[db_col] = edited_row[display_col]
+
+                            # Mettre à jour en base
+                            try:
+                                update_article_in_db(article_id, update_data)
+                                st.toast(
+                                    f"✅ Article ID {article_id} mis à jour", icon="✅",
+                                )
+                            except Exception as e:
+                                st.error(
+                                    f"Erreur lors de la mise à jour de l'article ID {article_id}: {e}",
+                                )
+
+        st.markdown("### ✅ Conservés")
+        if len(kept) > 0:
+            kept_display, _ = paginate_dataframe(
+                format_display_columns(kept), "kept_page", "kept_editor",
+            )
+            kept_display["🗑️ Supprimer"] = False
+
+            # Configuration des colonnes - ID en lecture seule
+            column_config = {}
+            if "ID" in kept_display.columns:
+                column_config["ID"] = st.column_config.NumberColumn(
+                    "ID",
+                    help="ID unique de l'article (non modifiable)",
+                    disabled=True,
+                    width="small",
+                )
+            column_config["🗑️ Supprimer"] = st.column_config.CheckboxColumn(
+                "🗑️", help="Supprimer l'article",
+            )
 
-if not df_db.empty:
-    kept = df_db[df_db["status"] == "accept"]
-    rejected = df_db[df_db["status"] == "reject"]
-    aside = df_db[df_db["status"] == "aside"]
-
-    # Fonction pour gérer les modifications et suppressions d'un tableau
-    def handle_table_actions(edited_df, original_df, status_name):
-        # Suppressions
-        delete_col = "🗑️ Supprimer"
-        if delete_col in edited_df.columns:
-            to_delete = edited_df[edited_df[delete_col]]
-            for _, row in to_delete.iterrows():
-                if "ID" in row:
-                    delete_article_from_db(row["ID"])
-                    st.toast(f"🗑️ Article ID {row['ID']} supprimé", icon="🗑️")
-            if not to_delete.empty:
-                st.rerun()
-
-        # Retirer la colonne de suppression pour la comparaison
-        if delete_col in edited_df.columns:
-            edited_df = edited_df.drop(columns=[delete_col])
-            original_df = original_df.drop(columns=[delete_col])
-
-        if not edited_df.equals(original_df):
-            st.success(f"📝 Modifications détectées dans {status_name}")
-
-            # Comparer ligne par ligne pour identifier les changements
-            for idx in range(len(edited_df)):
-                if idx < len(original_df):
-                    original_row = original_df.iloc[idx]
-                    edited_row = edited_df.iloc[idx]
-
-                    # Si c'est une ligne modifiée
-                    if not edited_row.equals(original_row):
-                        # Récupérer l'ID directement depuis la colonne ID du tableau édité
-                        if "ID" in edited_df.columns:
-                            article_id = edited_row["ID"]
-                        else:
-                            st.error("Impossible de trouver l'ID de l'article")
-                            continue
-
-                        # Préparer les données à mettre à jour (mapping inverse)
-                        update_data = {}
-                        column_mapping_reverse = {
-                            "Article Public Author Title": "title",
-                            "Journal": "journal",
-                            "ISSN": "issn",
-                            "DOI": "doi",
-                            "URL": "url",
-                            "Abstract Note": "abstract",
-                            "ABS LO UO": "abs_lo_uo",
-                            "Notes": "notes",
-                            "Type revue": "type_revue",
-                            "WL = mesure": "wl_mesure",
-                            "Chir = participants": "chir_participants",
-                            "Specialiste": "specialiste",
-                            "Intervention": "intervention",
-                            "Technique": "technique",
-                            "Contexte": "contexte",
-                            "Simulation": "simulation",
-                            "additional outcomes / exclusion": "additional_outcomes",
-                        }
-
-                        for display_col, db_col in column_mapping_reverse.items():
-                            if display_col in edited_df.columns:
-                                update_data[db_col] = edited_row[display_col]
-
-                        # Mettre à jour en base
-                        try:
-                            update_article_in_db(article_id, update_data)
-                            st.toast(
-                                f"✅ Article ID {article_id} mis à jour", icon="✅",
-                            )
-                        except Exception as e:
-                            st.error(
-                                f"Erreur lors de la mise à jour de l'article ID {article_id}: {e}",
-                            )
-
-    st.markdown("### ✅ Conservés")
-    if len(kept) > 0:
-        kept_display = format_display_columns(kept)
-        kept_display["🗑️ Supprimer"] = False
-
-        # Configuration des colonnes - ID en lecture seule
-        column_config = {}
-        if "ID" in kept_display.columns:
-            column_config["ID"] = st.column_config.NumberColumn(
-                "ID",
-                help="ID unique de l'article (non modifiable)",
-                disabled=True,
-                width="small",
+            edited_kept = st.data_editor(
+                kept_display,
+                use_container_width=True,
+                num_rows="fixed",
+                column_config=column_config,
+                key="kept_editor",
             )
-        column_config["🗑️ Supprimer"] = st.column_config.CheckboxColumn(
-            "🗑️", help="Supprimer l'article",
-        )
+            handle_table_actions(edited_kept, kept_display, "articles conservés")
+        else:
+            st.info("Aucun article conservé.")
 
-        edited_kept = st.data_editor(
-            kept_display,
-            use_container_width=True,
-            num_rows="fixed",
-            column_config=column_config,
-            key="kept_editor",
-        )
-        handle_table_actions(edited_kept, kept_display, "articles conservés")
-    else:
-        st.info("Aucun article conservé.")
-
-    st.markdown("### ❌ Rejetés")
-    if len(rejected) > 0:
-        rejected_display = format_display_columns(rejected)
-        rejected_display["🗑️ Supprimer"] = False
-
-        # Configuration des colonnes - ID en lecture seule
-        column_config = {}
-        if "ID" in rejected_display.columns:
-            column_config["ID"] = st.column_config.NumberColumn(
-                "ID",
-                help="ID unique de l'article (non modifiable)",
-                disabled=True,
-                width="small",
+        st.markdown("### ❌ Rejetés")
+        if len(rejected) > 0:
+            rejected_display, _ = paginate_dataframe(
+                format_display_columns(rejected), "rejected_page", "rejected_editor",
+            )
+            rejected_display["🗑️ Supprimer"] = False
+
+            # Configuration des colonnes - ID en lecture seule
+            column_config = {}
+            if "ID" in rejected_display.columns:
+                column_config["ID"] = st.column_config.NumberColumn(
+                    "ID",
+                    help="ID unique de l'article (non modifiable)",
+                    disabled=True,
+                    width="small",
+                )
+            column_config["🗑️ Supprimer"] = st.column_config.CheckboxColumn(
+                "🗑️", help="Supprimer l'article",
             )
-        column_config["🗑️ Supprimer"] = st.column_config.CheckboxColumn(
-            "🗑️", help="Supprimer l'article",
-        )
 
-        edited_rejected = st.data_editor(
-            rejected_display,
-            use_container_width=True,
-            num_rows="fixed",
-            column_config=column_config,
-            key="rejected_editor",
-        )
-        handle_table_actions(edited_rejected, rejected_display, "articles rejetés")
-    else:
-        st.info("Aucun article rejeté.")
-
-    st.markdown("### ⏸️ Mis de côté")
-    if len(aside) > 0:
-        aside_display = format_display_columns(aside)
-        aside_display["🗑️ Supprimer"] = False
-
-        # Configuration des colonnes - ID en lecture seule
-        column_config = {}
-        if "ID" in aside_display.columns:
-            column_config["ID"] = st.column_config.NumberColumn(
-                "ID",
-                help="ID unique de l'article (non modifiable)",
-                disabled=True,
-                width="small",
+            edited_rejected = st.data_editor(
+                rejected_display,
+                use_container_width=True,
+                num_rows="fixed",
+                column_config=column_config,
+                key="rejected_editor",
             )
-        column_config["🗑️ Supprimer"] = st.column_config.CheckboxColumn(
-            "🗑️", help="Supprimer l'article",
-        )
+            handle_table_actions(edited_rejected, rejected_display, "articles rejetés")
+        else:
+            st.info("Aucun article rejeté.")
 
-        edited_aside = st.data_editor(
-            aside_display,
-            use_container_width=True,
-            num_rows="fixed",
-            column_config=column_config,
-            key="aside_editor",
-        )
-        handle_table_actions(edited_aside, aside_display, "articles mis de côté")
+        st.markdown("### ⏸️ Mis de côté")
+        if len(aside) > 0:
+            aside_display, _ = paginate_dataframe(
+                format_display_columns(aside), "aside_page", "aside_editor",
+            )
+            aside_display["🗑️ Supprimer"] = False
+
+            # Configuration des colonnes - ID en lecture seule
+            column_config = {}
+            if "ID" in aside_display.columns:
+                column_config["ID"] = st.column_config.NumberColumn(
+                    "ID",
+                    help="ID unique de l'article (non modifiable)",
+                    disabled=True,
+                    width="small",
+                )
+            column_config["🗑️ Supprimer"] = st.column_config.CheckboxColumn(
+                "🗑️", help="Supprimer l'article",
+            )
+
+            edited_aside = st.data_editor(
+                aside_display,
+                use_container_width=True,
+                num_rows="fixed",
+                column_config=column_config,
+                key="aside_editor",
+            )
+            handle_table_actions(edited_aside, aside_display, "articles mis de côté")
+        else:
+            st.info("Aucun article mis de côté.")
+
+        # Boutons d'export (utilisent les données actuelles de la base)
+        st.markdown("### 📤 Export")
+        col_exp = st.columns(3)
+        with col_exp[0]:
+            if len(kept) > 0:
+                export_excel(kept, "articles_conserves")
+        with col_exp[1]:
+            if len(rejected) > 0:
+                export_excel(rejected, "articles_supprimes")
+        with col_exp[2]:
+            if len(aside) > 0:
+                export_excel(aside, "articles_mis_de_cote")
+
+        if st.button("🔄 Actualiser les données"):
+            fetch_articles_from_db.clear()
+            st.rerun()
     else:
-        st.info("Aucun article mis de côté.")
+        st.info("Aucun article trié en base de données.")
 
-    # Boutons d'export (utilisent les données actuelles de la base)
-    st.markdown("### 📤 Export")
-    col_exp = st.columns(3)
-    with col_exp[0]:
-        if len(kept) > 0:
-            export_excel(kept, "articles_conserves")
-    with col_exp[1]:
-        if len(rejected) > 0:
-            export_excel(rejected, "articles_supprimes")
-    with col_exp[2]:
-        if len(aside) > 0:
-            export_excel(aside, "articles_mis_de_cote")
 
-    if st.button("🔄 Actualiser les données"):
-        st.rerun()
-else:
-    st.info("Aucun article trié en base de données.")
+results_section()
+
 
 # === SECTION STATISTIQUES ===
 if not df_db.empty:
+    # Import différé : plotly n'est chargé que si des statistiques sont affichées
+    import plotly.express as px
+
     st.markdown("---")
     st.markdown("### 📊 Statistiques et Analytics")
 
-    # Préparer les données
-    df_stats = df_db.copy()
-
-    # Convertir date_action en datetime si ce n'est pas déjà fait
-    if "date_action" in df_stats.columns:
-        df_stats["date_action"] = pd.to_datetime(df_stats["date_action"])
-        df_stats["date_only"] = df_stats["date_action"].dt.date
+    # Préparer les données (mis en cache tant que la base n'a pas changé)
+    df_stats = prepare_stats_data(df_db)
 
     # Créer 3 colonnes pour les métriques principales
     col_metric1, col_metric2, col_metric3, col_metric4 = st.columns(4)
 
     total_articles = len(df_stats)
-    kept_count = len(df_stats[df_stats["status"] == "accept"])
-    rejected_count = len(df_stats[df_stats["status"] == "reject"])
-    aside_count = len(df_stats[df_stats["status"] == "aside"])
+    # Un seul passage sur la colonne statut, réutilisé par les métriques et le camembert
+    status_counts = df_stats["status"].value_counts()
+    kept_count = int(status_counts.get("accept", 0))
+    rejected_count = int(status_counts.get("reject", 0))
+    aside_count = int(status_counts.get("aside", 0))
 
     with col_metric1:
         st.metric("📚 Total Articles", total_articles)
@@ -1262,7 +1452,6 @@ if not df_db.empty:
 
     with col_chart1:
         st.markdown("#### 🥧 Répartition par statut")
-        status_counts = df_stats["status"].value_counts()
         status_mapping = {
             "accept": "Conservés",
             "reject": "Rejetés",
@@ -1310,11 +1499,10 @@ if not df_db.empty:
     col_chart3, col_chart4 = st.columns(2)
 
     with col_chart3:
-        if "journal" in df_stats.columns and df_stats["journal"].notna().sum() > 0:
+        # value_counts ignore déjà les NA : pas de filtrage ni de comptage préalable
+        if "journal" in df_stats.columns and df_stats["journal"].notna().any():
             st.markdown("#### 📰 Top 10 Journals")
-            top_journals = (
-                df_stats[df_stats["journal"].notna()]["journal"].value_counts().head(10)
-            )
+            top_journals = df_stats["journal"].value_counts().head(10)
 
             fig_bar = px.bar(
                 x=top_journals.values,
@@ -1356,9 +1544,9 @@ if not df_db.empty:
     col_chart5, col_chart6 = st.columns(2)
 
     with col_chart5:
-        if "year" in df_stats.columns and df_stats["year"].notna().sum() > 0:
+        if "year" in df_stats.columns and df_stats["year"].notna().any():
             st.markdown("#### 📅 Distribution par année de publication")
-            year_data = df_stats[df_stats["year"].notna()]["year"].astype(str)
+            year_data = df_stats["year"].dropna().astype(str)
             year_counts = year_data.value_counts().sort_index()
 
             fig_year = px.bar(
@@ -1378,14 +1566,10 @@ if not df_db.empty:
     with col_chart6:
         if (
             "specialiste" in df_stats.columns
-            and df_stats["specialiste"].notna().sum() > 0
+            and df_stats["specialiste"].notna().any()
         ):
             st.markdown("#### 🏥 Top Spécialités")
-            spec_counts = (
-                df_stats[df_stats["specialiste"].notna()]["specialiste"]
-                .value_counts()
-                .head(8)
-            )
+            spec_counts = df_stats["specialiste"].value_counts().head(8)
 
             fig_spec = px.bar(
                 x=spec_counts.index,
@@ -1407,9 +1591,6 @@ if not df_db.empty:
         st.markdown("#### 🔥 Heatmap de l'activité de tri")
 
         # Créer des données pour la heatmap
-        df_stats["hour"] = df_stats["date_action"].dt.hour
-        df_stats["day_name"] = df_stats["date_action"].dt.day_name()
-
         heatmap_data = (
             df_stats.groupby(["day_name", "hour"]).size().reset_index(name="count")
         )
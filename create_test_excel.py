@@ -56,7 +56,7 @@ data = {
 # Créer le DataFrame
 df = pd.DataFrame(data)
 
-# Sauvegarder en Excel
-df.to_excel('data_test.xlsx', index=False, engine='openpyxl')
+# Sauvegarder en Excel (moteur choisi par pandas : xlsxwriter s'il est installé)
+df.to_excel('data_test.xlsx', index=False)
 print("✅ Fichier data_test.xlsx créé avec 10 articles de test!")
 
@@ -2,8 +2,8 @@
 
 This module used to eagerly import a large number of submodules so that they
 were available as top level attributes of :mod:`src`.  Many of those imports
-pull in optional third party dependencies (for example ``xmltodict`` for the
-PubMed harvester).  Importing :mod:`src` would therefore fail on systems where
+pull in optional third party dependencies (for example ``matplotlib`` for the
+PRISMA diagram).  Importing :mod:`src` would therefore fail on systems where
 those heavy dependencies were not installed, even if the caller only needed a
 small subset of the functionality such as the lightweight pipeline utilities.
 
@@ -8,6 +8,7 @@ import argparse
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -15,13 +16,23 @@ from typing import Dict, List, Optional
 import pandas as pd
 
 from .config import config
-from .harvest import crossref, openalex, pubmed, unpaywall
-from .pipeline import deduplicate, enrich, filter_rules, normalize, prisma, report, scoring
-from .utils_io import load_dataframe, merge_dataframes, save_dataframe
-from .zotero.zotero_client import push_papers_to_zotero
+from .utils_io import (
+    find_latest_file,
+    load_dataframe,
+    merge_dataframes,
+    optimize_dtypes,
+    save_dataframe
+)
 
-# Setup logging
-logger = config.setup_logging()
+# Handlers are attached by main(); importing the module does not open the log file
+logger = logging.getLogger("lit_review_pipeline")
+
+# Columns read when pushing to Zotero: the screening keys plus the fields
+# used by ZoteroClient.create_item_from_paper
+ZOTERO_COLUMNS = [
+    'doi', 'id', 'pmid', 'title', 'authors', 'abstract', 'journal',
+    'year', 'url', 'lang', 'doc_type', 'source'
+]
 
 
 class LiteratureReviewPipeline:
@@ -43,6 +54,11 @@ class LiteratureReviewPipeline:
         }
         
         self.query_info = {}
+        
+        # One timestamp per run, formatted once for file names and tags
+        started_at = datetime.now()
+        self.run_timestamp = started_at.strftime("%Y%m%d_%H%M%S")
+        self.run_date = started_at.strftime("%Y-%m-%d")
     
     def harvest_papers(
         self,
@@ -76,74 +92,62 @@ class LiteratureReviewPipeline:
             'timestamp': datetime.now().isoformat()
         }
         
-        dataframes = []
-        source_names = []
-        
-        try:
-            # OpenAlex
-            logger.info("Harvesting from OpenAlex...")
-            openalex_df = openalex.get_works(
-                query=query,
-                year_from=year_from,
-                year_to=year_to,
-                max_results=top_n
-            )
-            if not openalex_df.empty:
-                dataframes.append(openalex_df)
-                source_names.append('openalex')
-                self.metrics['harvest']['openalex'] = len(openalex_df)
-                logger.info(f"OpenAlex: {len(openalex_df)} papers harvested")
-            
-        except Exception as e:
-            logger.error(f"Error harvesting from OpenAlex: {e}")
-            self.metrics['harvest']['openalex'] = 0
-        
-        try:
-            # Crossref
-            logger.info("Harvesting from Crossref...")
-            crossref_df = crossref.search_works(
-                query=query,
-                year_from=year_from,
-                year_to=year_to,
-                max_results=top_n
-            )
-            if not crossref_df.empty:
-                dataframes.append(crossref_df)
-                source_names.append('crossref')
-                self.metrics['harvest']['crossref'] = len(crossref_df)
-                logger.info(f"Crossref: {len(crossref_df)} papers harvested")
+        # Imported per command so other subcommands skip the harvester dependencies
+        from .harvest import crossref, openalex, pubmed
+        
+        # Sources are I/O bound and use independent sessions, so query them concurrently
+        sources = [
+            ('openalex', 'OpenAlex', openalex.get_works),
+            ('crossref', 'Crossref', crossref.search_works),
+            ('pubmed', 'PubMed', pubmed.search_and_fetch),
+        ]
+        
+        labels = {name: label for name, label, _ in sources}
+        results = {}
+        
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = {}
+            for name, label, harvest_fn in sources:
+                logger.info(f"Harvesting from {label}...")
+                future = executor.submit(
+                    harvest_fn,
+                    query=query,
+                    year_from=year_from,
+                    year_to=year_to,
+                    max_results=top_n
+                )
+                futures[future] = name
             
-        except Exception as e:
-            logger.error(f"Error harvesting from Crossref: {e}")
-            self.metrics['harvest']['crossref'] = 0
-        
-        try:
-            # PubMed
-            logger.info("Harvesting from PubMed...")
-            pubmed_df = pubmed.search_and_fetch(
-                query=query,
-                year_from=year_from,
-                year_to=year_to,
-                max_results=top_n
-            )
-            if not pubmed_df.empty:
-                dataframes.append(pubmed_df)
-                source_names.append('pubmed')
-                self.metrics['harvest']['pubmed'] = len(pubmed_df)
-                logger.info(f"PubMed: {len(pubmed_df)} papers harvested")
-            
-        except Exception as e:
-            logger.error(f"Error harvesting from PubMed: {e}")
-            self.metrics['harvest']['pubmed'] = 0
+            # Record each source as soon as it finishes rather than in submit order
+            for future in as_completed(futures):
+                name = futures[future]
+                label = labels[name]
+                try:
+                    source_df = future.result()
+                    if not source_df.empty:
+                        results[name] = source_df
+                        self.metrics['harvest'][name] = len(source_df)
+                        logger.info(f"{label}: {len(source_df)} papers harvested")
+                    
+                except Exception as e:
+                    logger.error(f"Error harvesting from {label}: {e}")
+                    self.metrics['harvest'][name] = 0
+        
+        # Merge in a fixed source order so the output is deterministic
+        source_names = [name for name, _, _ in sources if name in results]
+        dataframes = [results[name] for name in source_names]
         
         # Merge all dataframes
         if dataframes:
-            combined_df = merge_dataframes(dataframes, source_names)
+            combined_df = merge_dataframes(
+                dataframes, source_names, columns=config.standard_columns
+            )
+            # Low-cardinality column: category codes make filters/groupby cheaper
+            combined_df['source'] = combined_df['source'].astype('category')
             logger.info(f"Total harvested: {len(combined_df)} papers from {len(dataframes)} sources")
             
             # Save combined raw data
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            raw_file = config.data_dir / "raw" / f"combined_harvest_{timestamp}.csv"
+            raw_file = config.raw_dir / f"combined_harvest_{self.run_timestamp}.parquet"
             save_dataframe(combined_df, raw_file)
             
             return combined_df
@@ -173,6 +177,8 @@ class LiteratureReviewPipeline:
             logger.warning("No papers to process")
             return df
         
+        from .pipeline import deduplicate, enrich, filter_rules, normalize, scoring
+        
         logger.info(f"Processing {len(df)} harvested papers...")
         
         # Step 1: Normalize
@@ -184,6 +190,9 @@ class LiteratureReviewPipeline:
         logger.info("Step 2: Removing duplicates...")
         deduplicated_df, dedup_metrics = deduplicate.deduplicate_dataframe(normalized_df)
         self.metrics['deduplicate'] = dedup_metrics
+        # title_normalized only serves fuzzy matching; later stages and the
+        # saved output do not read it, so stop carrying a second title column
+        deduplicated_df = deduplicated_df.drop(columns=['title_normalized'], errors='ignore')
         
         # Step 3: Filter
         logger.info("Step 3: Applying filters...")
@@ -211,9 +220,19 @@ class LiteratureReviewPipeline:
         scored_df = scoring.score_papers(enriched_df, self.query_info.get('query', ''))
         self.metrics['scoring'] = {'final_count': len(scored_df)}
         
+        # Values are final after scoring: store low-cardinality columns compactly
+        # and long text as contiguous Arrow strings
+        scored_df = optimize_dtypes(
+            scored_df,
+            category_columns=['source', 'doc_type', 'lang', 'oa_status'],
+            integer_columns=['year', 'ai_label'],
+            string_columns=['title', 'abstract', 'authors', 'journal']
+        )
+        
         # Save processed data
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        processed_file = config.data_dir / "processed" / f"processed_papers_{timestamp}.csv"
+        processed_file = (
+            config.data_dir / "processed" / f"processed_papers_{self.run_timestamp}.parquet"
+        )
         save_dataframe(scored_df, processed_file)
         
         logger.info(f"Processing completed: {len(df)} → {len(scored_df)} papers")
@@ -234,6 +253,8 @@ class LiteratureReviewPipeline:
             return False
         
         try:
+            from .pipeline import scoring
+            
             output_path = config.outputs_dir / "to_screen.xlsx"
             scoring.prepare_screening_excel(df, output_path)
             logger.info(f"Screening file prepared: {output_path}")
@@ -265,13 +286,16 @@ class LiteratureReviewPipeline:
     def apply_screening_decisions(
         self,
         df: pd.DataFrame,
-        decisions_df: pd.DataFrame
+        decisions_df: pd.DataFrame,
+        total_screened: Optional[int] = None
     ) -> pd.DataFrame:
         """Apply manual screening decisions to papers.
         
         Args:
             df: Papers DataFrame
             decisions_df: Screening decisions DataFrame
+            total_screened: Number of screened papers when ``df`` was already
+                narrowed at load time; defaults to ``len(df)``
             
         Returns:
             DataFrame with only included papers
@@ -280,30 +304,101 @@ class LiteratureReviewPipeline:
             logger.warning("Cannot apply screening decisions: missing data")
             return df
         
-        # Get included papers
+        # Get included papers, one decision row per paper; keys are compared
+        # as strings since Excel may read numeric IDs (PMIDs) as ints
         included_decisions = decisions_df[decisions_df['decision'] == 'include']
-        included_ids = set(included_decisions['paper_id'].tolist())
+        included_decisions = included_decisions.dropna(subset=['paper_id'])
+        included_decisions = included_decisions.assign(
+            paper_id=included_decisions['paper_id'].astype(str)
+        ).drop_duplicates('paper_id', keep='last')
+        
+        # Remaining decision columns (reviewer notes, reasons...) travel with
+        # the papers under a screening_ prefix
+        decision_info = included_decisions.drop(columns=['decision']).rename(
+            columns=lambda col: '_paper_key' if col == 'paper_id' else f'screening_{col}'
+        )
         
         # Filter DataFrame
         # Try to match by DOI first, then by other IDs
-        included_df = pd.DataFrame()
+        empty = pd.Series('', index=df.index)
+        doi = df['doi'] if 'doi' in df.columns else empty
+        ident = df['id'] if 'id' in df.columns else empty
+        paper_ids = doi.where(doi.notna() & (doi.astype(str) != ''), ident).fillna('').astype(str)
         
-        for _, row in df.iterrows():
-            paper_id = row.get('doi', row.get('id', ''))
-            if paper_id in included_ids:
-                included_df = pd.concat([included_df, row.to_frame().T], ignore_index=True)
+        # One hash join keeps the included papers (in their original order)
+        # and attaches their decision metadata
+        included_df = df.assign(_paper_key=paper_ids).merge(
+            decision_info,
+            on='_paper_key',
+            how='inner',
+            validate='many_to_one'
+        ).drop(columns=['_paper_key'])
         
-        logger.info(f"Applied screening decisions: {len(df)} → {len(included_df)} papers included")
+        if total_screened is None:
+            total_screened = len(df)
+        
+        logger.info(f"Applied screening decisions: {total_screened} → {len(included_df)} papers included")
         
         # Update metrics
         self.metrics['screening'] = {
-            'total_screened': len(df),
+            'total_screened': total_screened,
             'included_count': len(included_df),
-            'excluded_count': len(df) - len(included_df)
+            'excluded_count': total_screened - len(included_df)
         }
         
         return included_df
     
+    def load_included_papers(
+        self,
+        filepath: Path,
+        decisions_df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Load processed papers and keep those with an 'include' decision.
+        
+        For Parquet files the DOI/ID match is pushed down to the reader, so
+        only candidate rows are materialized; the exact DOI-then-ID match
+        is still done by apply_screening_decisions.
+        
+        Args:
+            filepath: Processed papers file
+            decisions_df: Screening decisions DataFrame
+            
+        Returns:
+            DataFrame with only included papers
+        """
+        if filepath.suffix.lower() != '.parquet' or decisions_df.empty:
+            return self.apply_screening_decisions(load_dataframe(filepath), decisions_df)
+        
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        included = decisions_df.loc[decisions_df['decision'] == 'include', 'paper_id']
+        included_ids = [str(paper_id) for paper_id in included.dropna().unique()]
+        schema = pq.read_schema(filepath)
+        key_columns = [col for col in ('doi', 'id') if col in schema.names]
+        # Pushdown needs string key columns; an all-null column is stored as null
+        pushdown = included_ids and key_columns and all(
+            pa.types.is_string(schema.field(col).type)
+            or pa.types.is_large_string(schema.field(col).type)
+            for col in key_columns
+        )
+        if not pushdown:
+            return self.apply_screening_decisions(load_dataframe(filepath), decisions_df)
+        
+        filters = [[(col, 'in', included_ids)] for col in key_columns]
+        
+        try:
+            candidates = load_dataframe(filepath, filters=filters)
+        except Exception as e:
+            logger.debug(f"Filtered parquet read failed, loading all papers: {e}")
+            return self.apply_screening_decisions(load_dataframe(filepath), decisions_df)
+        
+        return self.apply_screening_decisions(
+            candidates,
+            decisions_df,
+            total_screened=pq.read_metadata(filepath).num_rows
+        )
+    
     def push_to_zotero(
         self,
         df: pd.DataFrame,
@@ -325,9 +420,11 @@ class LiteratureReviewPipeline:
             return False
         
         try:
+            from .zotero.zotero_client import push_papers_to_zotero
+            
             # Add pipeline tags
             default_tags = [
-                f"lit-review-{datetime.now().strftime('%Y-%m-%d')}",
+                f"lit-review-{self.run_date}",
                 "automated-import"
             ]
             
@@ -358,6 +455,8 @@ class LiteratureReviewPipeline:
             True if successful, False otherwise
         """
         try:
+            from .pipeline import prisma, report
+            
             # Update final metrics
             self.metrics['final_included'] = len(df)
             self.metrics['end_time'] = time.time()
@@ -430,15 +529,14 @@ def cmd_process(args):
     pipeline = LiteratureReviewPipeline()
     
     # Load latest harvest data
-    raw_dir = config.data_dir / "raw"
-    harvest_files = list(raw_dir.glob("combined_harvest_*.csv"))
+    raw_dir = config.raw_dir
+    latest_file = find_latest_file(raw_dir, "combined_harvest_")
     
-    if not harvest_files:
+    if latest_file is None:
         logger.error("No harvest files found. Run 'harvest' command first.")
         return False
     
     # Load most recent harvest
-    latest_file = max(harvest_files, key=lambda x: x.stat().st_mtime)
     logger.info(f"Loading harvest data from {latest_file}")
     
     try:
@@ -499,18 +597,17 @@ def cmd_zotero_push(args):
     
     # Load processed papers
     processed_dir = config.data_dir / "processed"
-    processed_files = list(processed_dir.glob("processed_papers_*.csv"))
+    latest_file = find_latest_file(processed_dir, "processed_papers_")
     
-    if not processed_files:
+    if latest_file is None:
         logger.error("No processed papers found. Run 'process' command first.")
         return False
     
     # Load most recent processed file
-    latest_file = max(processed_files, key=lambda x: x.stat().st_mtime)
     logger.info(f"Loading processed papers from {latest_file}")
     
     try:
-        processed_df = load_dataframe(latest_file)
+        processed_df = load_dataframe(latest_file, columns=ZOTERO_COLUMNS)
     except Exception as e:
         logger.error(f"Error loading processed papers: {e}")
         return False
@@ -548,24 +645,16 @@ def cmd_report(args):
     # First try screening decisions
     decisions_df = pipeline.load_screening_decisions()
     
-    if not decisions_df.empty:
-        # Load processed papers and apply decisions
-        processed_dir = config.data_dir / "processed"
-        processed_files = list(processed_dir.glob("processed_papers_*.csv"))
-        
-        if processed_files:
-            latest_file = max(processed_files, key=lambda x: x.stat().st_mtime)
-            processed_df = load_dataframe(latest_file)
-            df = pipeline.apply_screening_decisions(processed_df, decisions_df)
+    processed_dir = config.data_dir / "processed"
+    latest_file = find_latest_file(processed_dir, "processed_papers_")
+    
+    if latest_file is not None and not decisions_df.empty:
+        # Load only the included processed papers
+        df = pipeline.load_included_papers(latest_file, decisions_df)
     
     # If no screening decisions, use all processed papers
-    if df.empty:
-        processed_dir = config.data_dir / "processed"
-        processed_files = list(processed_dir.glob("processed_papers_*.csv"))
-        
-        if processed_files:
-            latest_file = max(processed_files, key=lambda x: x.stat().st_mtime)
-            df = load_dataframe(latest_file)
+    if df.empty and latest_file is not None:
+        df = load_dataframe(latest_file)
     
     if df.empty:
         logger.error("No papers found for reporting. Run the pipeline first.")
@@ -639,6 +728,9 @@ Examples:
         parser.print_help()
         return 1
     
+    # Setup logging (idempotent: handlers are only added once per process)
+    config.setup_logging()
+    
     # Check configuration
     missing_creds = config.get_missing_credentials()
     if missing_creds:
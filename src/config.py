@@ -7,8 +7,10 @@ This module handles all configuration settings including:
 - Output settings
 """
 
+import json
 import logging
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -23,21 +25,51 @@ except ImportError:
     load_dotenv()
 
 
+class JsonLogFormatter(logging.Formatter):
+    """Format log records as one JSON object per line.
+    
+    Fields are serialized with ``json.dumps``, so quotes and newlines in
+    messages are escaped and every line stays valid JSON.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as a JSON line."""
+        entry = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "module": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
 class Config:
-    """Central configuration class for the literature review pipeline."""
+    """Central configuration class for the literature review pipeline.
+    
+    Config is a singleton: every ``Config()`` call returns the shared
+    instance. Data directories are created on first access rather than
+    at import time.
+    """
+    
+    _instance: Optional["Config"] = None
+    
+    def __new__(cls):
+        """Return the shared configuration instance."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
     
     def __init__(self):
         """Initialize configuration with environment variables and defaults."""
-        # Project paths
-        self.project_root = Path(__file__).parent.parent
-        self.data_dir = self.project_root / "data"
-        self.models_dir = self.project_root / "models"
-        self.outputs_dir = self.data_dir / "outputs"
-        self.logs_dir = self.data_dir / "logs"
+        if self._initialized:
+            return
+        self._initialized = True
         
-        # Ensure directories exist
-        for dir_path in [self.data_dir, self.models_dir, self.outputs_dir, self.logs_dir]:
-            dir_path.mkdir(parents=True, exist_ok=True)
+        # Project paths (directories are exposed lazily, see below)
+        self.project_root = Path(__file__).parent.parent
         
         # API Configuration
         self.openalex_base = os.getenv("OPENALEX_BASE", "https://api.openalex.org")
@@ -45,6 +77,7 @@ class Config:
         self.zotero_user_id = os.getenv("ZOTERO_USER_ID", "")
         self.zotero_api_key = os.getenv("ZOTERO_API_KEY", "")
         self.pubmed_email = os.getenv("PUBMED_EMAIL", "")
+        self.pubmed_api_key = os.getenv("PUBMED_API_KEY", "")
         self.crossref_mailto = os.getenv("CROSSREF_MAILTO", "")
         self.scopus_api_key = os.getenv("SCOPUS_API_KEY", "")
         
@@ -69,7 +102,6 @@ class Config:
         self.year_tolerance = int(os.getenv("YEAR_TOLERANCE", "1"))
         
         # Scoring Model
-        self.model_path = self.models_dir / os.getenv("MODEL_PATH", "screening_model.joblib")
         self.confidence_threshold = float(os.getenv("CONFIDENCE_THRESHOLD", "0.5"))
         
         # Output Settings
@@ -89,7 +121,7 @@ class Config:
         self.rate_limits = {
             "openalex": 10,
             "crossref": 50,
-            "pubmed": 3,
+            "pubmed": 10 if self.pubmed_api_key else 3,  # NCBI allows 10/s with an API key
             "unpaywall": 100,
             "zotero": 1,
         }
@@ -108,6 +140,52 @@ class Config:
             "lang", "url", "pdf_url", "oa_status"
         ]
     
+    @staticmethod
+    def _ensure_dir(dir_path: Path) -> Path:
+        """Create a directory if needed and return it."""
+        dir_path.mkdir(parents=True, exist_ok=True)
+        return dir_path
+    
+    @cached_property
+    def data_dir(self) -> Path:
+        """Data directory, created on first access."""
+        return self._ensure_dir(self.project_root / "data")
+    
+    @cached_property
+    def models_dir(self) -> Path:
+        """Model directory, created on first access."""
+        return self._ensure_dir(self.project_root / "models")
+    
+    @cached_property
+    def outputs_dir(self) -> Path:
+        """Output directory, created on first access."""
+        return self._ensure_dir(self.data_dir / "outputs")
+    
+    @cached_property
+    def logs_dir(self) -> Path:
+        """Log directory, created on first access."""
+        return self._ensure_dir(self.data_dir / "logs")
+    
+    @cached_property
+    def raw_dir(self) -> Path:
+        """Raw harvest directory, created on first access."""
+        return self._ensure_dir(self.data_dir / "raw")
+    
+    @cached_property
+    def interim_dir(self) -> Path:
+        """Interim per-source results directory, created on first access."""
+        return self._ensure_dir(self.data_dir / "interim")
+    
+    @cached_property
+    def cache_dir(self) -> Path:
+        """HTTP response cache directory, created on first access."""
+        return self._ensure_dir(self.data_dir / "cache")
+    
+    @cached_property
+    def model_path(self) -> Path:
+        """Path of the saved screening model."""
+        return self.models_dir / os.getenv("MODEL_PATH", "screening_model.joblib")
+    
     def validate_api_credentials(self) -> Dict[str, bool]:
         """Validate that required API credentials are present."""
         credentials = {
@@ -140,10 +218,7 @@ class Config:
             
             # Create formatter
             if self.log_format.lower() == "json":
-                formatter = logging.Formatter(
-                    '{"timestamp": "%(asctime)s", "level": "%(levelname)s", '
-                    '"module": "%(name)s", "message": "%(message)s"}'
-                )
+                formatter = JsonLogFormatter()
             else:
                 formatter = logging.Formatter(
                     "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
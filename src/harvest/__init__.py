@@ -5,8 +5,33 @@ This module contains all the harvesting functionality for different academic dat
 - Crossref: DOI registration agency with metadata
 - PubMed: Biomedical literature database
 - Unpaywall: Open access article finder
+
+Harvesters are imported lazily on first access, as in :mod:`src`, so that
+importing one source does not pull in the dependencies of the others.
 """
 
-from . import crossref, openalex, pubmed, unpaywall
+from __future__ import annotations
+
+from importlib import import_module
+from types import ModuleType
+from typing import Dict
+
+_LAZY_MODULES: Dict[str, str] = {
+    "openalex": "src.harvest.openalex",
+    "crossref": "src.harvest.crossref",
+    "pubmed": "src.harvest.pubmed",
+    "unpaywall": "src.harvest.unpaywall",
+}
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import harvester submodules on first access."""
+
+    if name in _LAZY_MODULES:
+        module = import_module(_LAZY_MODULES[name])
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["openalex", "crossref", "pubmed", "unpaywall"]
@@ -6,24 +6,38 @@ from the Crossref database using their REST API.
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
-from urllib.parse import quote
+from urllib.parse import urlencode
 
 import pandas as pd
 import requests
 
 from ..config import config
 from ..utils_io import (
+    RequestPacer,
     log_api_call,
+    open_jsonl,
+    parse_json_response,
     rate_limited_request,
     save_dataframe,
-    save_jsonl,
     setup_session,
+    write_jsonl,
 )
 
 logger = logging.getLogger(__name__)
 
+# Pages requested in parallel once the total result count is known
+MAX_CONCURRENT_PAGES = 4
+
+# Raw work fields read by CrossrefHarvester.parse_works
+CROSSREF_FIELDS = [
+    "DOI", "title", "author", "container-title", "published-print",
+    "published-online", "created", "abstract", "URL", "type", "language",
+    "is-referenced-by-count",
+]
+
 
 class CrossrefHarvester:
     """Crossref API client for harvesting academic works."""
@@ -31,7 +45,7 @@ class CrossrefHarvester:
     def __init__(self):
         """Initialize the Crossref harvester."""
         self.base_url = "https://api.crossref.org"
-        self.session = setup_session()
+        self.session = setup_session(pool_maxsize=MAX_CONCURRENT_PAGES)
         self.rate_limit = config.rate_limits["crossref"]
         
         # Set User-Agent and mailto headers
@@ -39,130 +53,165 @@ class CrossrefHarvester:
             "User-Agent": f"LitReviewPipeline/1.0 (mailto:{config.crossref_mailto or 'example@example.com'})",
         })
         
-    def build_query_url(
+    def build_query_prefix(
         self,
         query: str,
         year_from: int,
         year_to: int,
         rows: int = 200,
-        offset: int = 0,
         filters: Optional[Dict[str, str]] = None
     ) -> str:
-        """Build Crossref query URL.
+        """Build the Crossref query URL without its page offset.
+        
+        The prefix is the same for every page of a search, so it is built
+        once and only the offset is appended per page.
         
         Args:
             query: Search query string
             year_from: Start year for filtering
             year_to: End year for filtering
             rows: Number of results per page
-            offset: Starting offset
             filters: Additional filters to apply
             
         Returns:
-            Complete query URL
+            Query URL ready for an ``&offset=`` suffix
         """
         # Build base URL
         url = f"{self.base_url}/works"
         
+        # Build filter string
+        filter_parts = [f"from-pub-date:{year_from}", f"until-pub-date:{year_to}"]
+        if filters:
+            filter_parts.extend(f"{k}:{v}" for k, v in filters.items())
+        
         # Build parameters
         params = {
             "query": query,
-            "filter": f"from-pub-date:{year_from},until-pub-date:{year_to}",
+            "filter": ",".join(filter_parts),
             "rows": rows,
-            "offset": offset,
             "sort": "relevance",
             "order": "desc",
         }
         
-        # Add additional filters
-        if filters:
-            existing_filter = params.get("filter", "")
-            additional_filters = ",".join([f"{k}:{v}" for k, v in filters.items()])
-            if existing_filter:
-                params["filter"] = f"{existing_filter},{additional_filters}"
-            else:
-                params["filter"] = additional_filters
-        
-        # Build complete URL
-        param_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        return f"{url}?{param_string}"
+        return f"{url}?{urlencode(params, safe=':,')}"
     
-    def parse_work(self, work: Dict) -> Dict:
-        """Parse a single work from Crossref response.
+    def build_query_url(
+        self,
+        query: str,
+        year_from: int,
+        year_to: int,
+        rows: int = 200,
+        offset: int = 0,
+        filters: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Build Crossref query URL.
         
         Args:
-            work: Raw work data from Crossref
+            query: Search query string
+            year_from: Start year for filtering
+            year_to: End year for filtering
+            rows: Number of results per page
+            offset: Starting offset
+            filters: Additional filters to apply
             
         Returns:
-            Standardized work dictionary
+            Complete query URL
         """
-        # Extract DOI
-        doi = work.get("DOI", "")
+        prefix = self.build_query_prefix(query, year_from, year_to, rows, filters)
+        return f"{prefix}&offset={offset}"
+    
+    def parse_works(self, works: List[Dict]) -> pd.DataFrame:
+        """Parse a page of works from Crossref response.
         
-        # Extract title
-        title = ""
-        if work.get("title"):
-            title = work["title"][0] if isinstance(work["title"], list) else work["title"]
+        Fields are extracted column by column with vectorized pandas
+        operations rather than one record at a time.
         
-        # Extract authors
-        authors = []
-        if work.get("author"):
-            for author in work["author"]:
-                given = author.get("given", "")
-                family = author.get("family", "")
-                if family:
-                    if given:
-                        authors.append(f"{family}, {given}")
-                    else:
-                        authors.append(family)
-        authors_str = "; ".join(authors)
+        Args:
+            works: Raw work data from Crossref
+            
+        Returns:
+            DataFrame of standardized works
+        """
+        raw = pd.DataFrame(works).reindex(columns=CROSSREF_FIELDS).astype(object)
         
-        # Extract journal
-        journal = ""
-        if work.get("container-title"):
-            journal = work["container-title"][0] if isinstance(work["container-title"], list) else work["container-title"]
+        # Extract DOI
+        doi = raw["DOI"].fillna("")
         
-        # Extract year
-        year = None
-        if work.get("published-print", {}).get("date-parts"):
-            year = work["published-print"]["date-parts"][0][0]
-        elif work.get("published-online", {}).get("date-parts"):
-            year = work["published-online"]["date-parts"][0][0]
-        elif work.get("created", {}).get("date-parts"):
-            year = work["created"]["date-parts"][0][0]
+        # Extract authors as "family, given", skipping entries without a family name
+        author = raw["author"].explode()
+        family = author.str.get("family").fillna("")
+        given = author.str.get("given").fillna("")
+        names = family.where(given == "", family + ", " + given)[family != ""]
+        authors = names.groupby(level=0).agg("; ".join).reindex(raw.index, fill_value="")
         
-        # Extract abstract (rarely available in Crossref)
-        abstract = work.get("abstract", "")
+        # Extract year from the print, online or creation date, in that order
+        date_parts = raw["published-print"].str.get("date-parts")
+        for date_field in ["published-online", "created"]:
+            date_parts = date_parts.combine_first(raw[date_field].str.get("date-parts"))
+        year = date_parts.str[0].str[0]
         
         # Extract URL
-        url = work.get("URL", f"https://doi.org/{doi}" if doi else "")
-        
-        # Extract document type
-        doc_type = work.get("type", "")
+        url = raw["URL"].fillna(("https://doi.org/" + doi).where(doi != "", ""))
         
-        # Extract language
-        lang = work.get("language", "")
-        
-        # Extract citation count (if available)
-        cited_by = work.get("is-referenced-by-count", 0)
-        
-        return {
+        return pd.DataFrame({
             "source": "crossref",
             "id": doi,
             "doi": doi,
             "pmid": "",  # Crossref doesn't directly provide PMID
-            "title": title,
-            "abstract": abstract,
-            "authors": authors_str,
-            "journal": journal,
-            "year": year,
-            "doc_type": doc_type,
-            "lang": lang,
+            "title": raw["title"].str[0].fillna(""),
+            "abstract": raw["abstract"].fillna(""),  # Rarely available in Crossref
+            "authors": authors,
+            "journal": raw["container-title"].str[0].fillna(""),
+            "year": pd.to_numeric(year),
+            "doc_type": raw["type"].fillna(""),
+            "lang": raw["language"].fillna(""),
             "url": url,
             "pdf_url": "",  # Will be enriched later via Unpaywall
             "oa_status": "unknown",  # Will be enriched later
-            "cited_by": cited_by,
-        }
+            "cited_by": pd.to_numeric(raw["is-referenced-by-count"]).fillna(0).astype("int64"),
+        })
+    
+    def fetch_page(
+        self,
+        url: str,
+        query: str,
+        offset: int,
+        rows: int,
+        pacer: RequestPacer
+    ) -> Dict:
+        """Fetch and log one page of Crossref results.
+        
+        Args:
+            url: Page URL
+            query: Search query string (for logging)
+            offset: Page offset (for logging)
+            rows: Number of results per page (for logging)
+            pacer: Shared pacer keeping concurrent requests under the rate limit
+            
+        Returns:
+            Decoded JSON response
+        """
+        logger.info(f"Fetching offset {offset} from Crossref...")
+        
+        # Make rate-limited request
+        response = rate_limited_request(self.session, url, delay=pacer.reserve())
+        
+        data = parse_json_response(response)
+        
+        # Log API call
+        message = data.get("message", {})
+        log_api_call(
+            logger,
+            "crossref",
+            url,
+            {"query": query, "offset": offset, "rows": rows},
+            {
+                "status": response.status_code,
+                "results": len(message.get("items", [])),
+                "total": message.get("total-results", 0)
+            }
+        )
+        return data
     
     def search_works(
         self,
@@ -174,6 +223,10 @@ class CrossrefHarvester:
     ) -> pd.DataFrame:
         """Search for works in Crossref.
         
+        The first page gives the total result count; the remaining offsets
+        are then fetched concurrently, paced to the Crossref rate limit, and
+        processed in offset order.
+        
         Args:
             query: Search query string
             year_from: Start year for filtering
@@ -186,92 +239,79 @@ class CrossrefHarvester:
         """
         logger.info(f"Starting Crossref search: '{query}' ({year_from}-{year_to})")
         
-        all_works = []
-        offset = 0
+        page_frames = []
         total_retrieved = 0
+        pacer = RequestPacer(self.rate_limit)
         
         # Prepare raw data storage
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        raw_file = config.data_dir / "raw" / f"crossref_{timestamp}.jsonl"
-        raw_file.parent.mkdir(parents=True, exist_ok=True)
+        raw_file = config.raw_dir / f"crossref_{timestamp}.jsonl.gz"
         
-        while total_retrieved < max_results:
-            try:
-                # Build URL for this page
-                url = self.build_query_url(
-                    query=query,
-                    year_from=year_from,
-                    year_to=year_to,
-                    rows=rows,
-                    offset=offset
-                )
-                
-                logger.info(f"Fetching offset {offset} from Crossref...")
-                
-                # Make rate-limited request
-                response = rate_limited_request(
-                    self.session,
-                    url,
-                    delay=1.0 / self.rate_limit
-                )
-                
-                data = response.json()
-                
-                # Check for API errors
-                if data.get("status") != "ok":
-                    logger.error(f"Crossref API error: {data}")
-                    break
-                
-                # Log API call
-                message = data.get("message", {})
-                log_api_call(
-                    logger,
-                    "crossref",
-                    url,
-                    {"query": query, "offset": offset, "rows": rows},
-                    {
-                        "status": response.status_code,
-                        "results": len(message.get("items", [])),
-                        "total": message.get("total-results", 0)
-                    }
-                )
-                
-                # Parse results
-                works = message.get("items", [])
-                if not works:
-                    logger.info("No more results available")
+        # Only the offset changes from page to page
+        url_prefix = self.build_query_prefix(query, year_from, year_to, rows)
+        
+        def request_page(offset: int) -> Dict:
+            return self.fetch_page(f"{url_prefix}&offset={offset}", query, offset, rows, pacer)
+        
+        # Keep the raw file open for the whole search rather than once per page
+        with open_jsonl(raw_file, "a") as raw_fh, \
+                ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAGES) as executor:
+            pending = [(0, executor.submit(request_page, 0))]
+            
+            while pending:
+                offset, future = pending.pop(0)
+                try:
+                    data = future.result()
+                    
+                    # Check for API errors
+                    if data.get("status") != "ok":
+                        logger.error(f"Crossref API error: {data}")
+                        break
+                    
+                    message = data.get("message", {})
+                    works = message.get("items", [])
+                    if not works:
+                        logger.info("No more results available")
+                        break
+                    
+                    # The first page tells how many offsets remain: request them all
+                    if offset == 0:
+                        total = min(message.get("total-results", 0), max_results)
+                        pending = [
+                            (next_offset, executor.submit(request_page, next_offset))
+                            for next_offset in range(rows, total, rows)
+                        ]
+                    
+                    # Save raw data
+                    write_jsonl(works, raw_fh)
+                    
+                    # Parse and add to collection
+                    page_frames.append(self.parse_works(works))
+                    
+                    total_retrieved += len(works)
+                    logger.info(f"Retrieved {total_retrieved} works so far")
+                    
+                    # Check if we've reached the end
+                    if len(works) < rows or total_retrieved >= max_results:
+                        break
+                    
+                except requests.RequestException as e:
+                    logger.error(f"Error fetching offset {offset}: {e}")
                     break
-                
-                # Save raw data
-                save_jsonl(works, raw_file, append=True)
-                
-                # Parse and add to collection
-                for work in works:
-                    parsed_work = self.parse_work(work)
-                    all_works.append(parsed_work)
-                
-                total_retrieved += len(works)
-                logger.info(f"Retrieved {total_retrieved} works so far")
-                
-                # Check if we've reached the end
-                if len(works) < rows or total_retrieved >= max_results:
+                except Exception as e:
+                    logger.error(f"Unexpected error at offset {offset}: {e}")
                     break
-                
-                offset += rows
-                
-            except requests.RequestException as e:
-                logger.error(f"Error fetching offset {offset}: {e}")
-                break
-            except Exception as e:
-                logger.error(f"Unexpected error at offset {offset}: {e}")
-                break
+            
+            # Pages queued after a stop are not needed
+            for _, future in pending:
+                future.cancel()
         
-        # Convert to DataFrame
-        df = pd.DataFrame(all_works)
+        # Combine the parsed pages
+        df = pd.concat(page_frames, ignore_index=True) if page_frames else pd.DataFrame()
         
         # Save processed data
         if not df.empty:
-            processed_file = config.data_dir / "interim" / f"crossref_{timestamp}.csv"
+            processed_file = config.interim_dir / f"crossref_{timestamp}.parquet"
             save_dataframe(df, processed_file)
             logger.info(f"Saved {len(df)} works to {processed_file}")
         
@@ -6,24 +6,62 @@ from the OpenAlex database using their REST API.
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
-from urllib.parse import quote
+from urllib.parse import urlencode
 
 import pandas as pd
 import requests
 
 from ..config import config
 from ..utils_io import (
+    RequestPacer,
     log_api_call,
+    open_jsonl,
+    parse_json_response,
     rate_limited_request,
     save_dataframe,
-    save_jsonl,
     setup_session,
+    write_jsonl,
 )
 
 logger = logging.getLogger(__name__)
 
+# Pages requested in parallel once the total result count is known
+MAX_CONCURRENT_PAGES = 4
+
+# Raw work fields read by OpenAlexHarvester.parse_works
+OPENALEX_FIELDS = [
+    "id", "doi", "title", "abstract", "abstract_inverted_index", "authorships",
+    "primary_location", "open_access", "best_oa_location", "publication_year",
+    "type", "language", "cited_by_count",
+]
+
+
+def abstract_from_inverted_index(inverted_index: Optional[Dict[str, List[int]]]) -> str:
+    """Rebuild abstract text from an OpenAlex ``abstract_inverted_index``.
+    
+    Args:
+        inverted_index: Mapping of each word to its positions in the abstract
+        
+    Returns:
+        Abstract text, or an empty string if no index is available
+    """
+    if not isinstance(inverted_index, dict) or not inverted_index:
+        return ""
+    
+    # Positions are dense, so fill a list by index instead of sorting them
+    last_position = max(
+        (max(positions) for positions in inverted_index.values() if positions),
+        default=-1
+    )
+    words = [""] * (last_position + 1)
+    for word, positions in inverted_index.items():
+        for position in positions:
+            words[position] = word
+    return " ".join(word for word in words if word)
+
 
 class OpenAlexHarvester:
     """OpenAlex API client for harvesting academic works."""
@@ -31,34 +69,32 @@ class OpenAlexHarvester:
     def __init__(self):
         """Initialize the OpenAlex harvester."""
         self.base_url = config.openalex_base
-        self.session = setup_session()
+        self.session = setup_session(pool_maxsize=MAX_CONCURRENT_PAGES)
         self.rate_limit = config.rate_limits["openalex"]
         
-    def build_query_url(
+    def build_query_prefix(
         self,
         query: str,
         year_from: int,
         year_to: int,
         per_page: int = 200,
-        page: int = 1,
         filters: Optional[Dict[str, str]] = None
     ) -> str:
-        """Build OpenAlex query URL.
+        """Build the OpenAlex query URL without its page number.
+        
+        The prefix is the same for every page of a search, so it is built
+        once and only the page number is appended per page.
         
         Args:
             query: Search query string
             year_from: Start year for filtering
             year_to: End year for filtering
             per_page: Number of results per page
-            page: Page number
             filters: Additional filters to apply
             
         Returns:
-            Complete query URL
+            Query URL ready for a ``&page=`` suffix
         """
-        # Encode the query
-        encoded_query = quote(query)
-        
         # Build base URL
         url = f"{self.base_url}/works"
         
@@ -73,78 +109,145 @@ class OpenAlexHarvester:
         
         filter_string = ",".join(filter_parts)
         
-        # Build complete URL
+        # Build parameters
         params = {
             "search": query,
             "filter": filter_string,
             "per-page": per_page,
-            "page": page,
             "mailto": config.crossref_mailto or "example@example.com",
         }
         
-        param_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        return f"{url}?{param_string}"
+        return f"{url}?{urlencode(params, safe=':,@')}"
     
-    def parse_work(self, work: Dict) -> Dict:
-        """Parse a single work from OpenAlex response.
+    def build_query_url(
+        self,
+        query: str,
+        year_from: int,
+        year_to: int,
+        per_page: int = 200,
+        page: int = 1,
+        filters: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Build OpenAlex query URL.
         
         Args:
-            work: Raw work data from OpenAlex
+            query: Search query string
+            year_from: Start year for filtering
+            year_to: End year for filtering
+            per_page: Number of results per page
+            page: Page number
+            filters: Additional filters to apply
+            
+        Returns:
+            Complete query URL
+        """
+        prefix = self.build_query_prefix(query, year_from, year_to, per_page, filters)
+        return f"{prefix}&page={page}"
+    
+    def parse_works(self, works: List[Dict]) -> pd.DataFrame:
+        """Parse a page of works from OpenAlex response.
+        
+        Fields are extracted column by column with vectorized pandas
+        operations rather than one record at a time.
+        
+        Args:
+            works: Raw work data from OpenAlex
             
         Returns:
-            Standardized work dictionary
+            DataFrame of standardized works
         """
+        raw = pd.DataFrame(works).reindex(columns=OPENALEX_FIELDS).astype(object)
+        
         # Extract DOI
-        doi = ""
-        if work.get("doi"):
-            doi = work["doi"].replace("https://doi.org/", "")
+        raw_doi = raw["doi"].fillna("")
+        doi = raw_doi.str.removeprefix("https://doi.org/")
         
         # Extract authors
-        authors = []
-        if work.get("authorships"):
-            for authorship in work["authorships"]:
-                author = authorship.get("author", {})
-                if author.get("display_name"):
-                    authors.append(author["display_name"])
-        authors_str = "; ".join(authors) if authors else ""
+        author_names = raw["authorships"].explode().str.get("author").str.get("display_name")
+        author_names = author_names[author_names.notna() & (author_names != "")]
+        authors = author_names.groupby(level=0).agg("; ".join).reindex(raw.index, fill_value="")
         
         # Extract journal
-        journal = ""
-        if work.get("primary_location", {}).get("source"):
-            journal = work["primary_location"]["source"].get("display_name", "")
+        journal = raw["primary_location"].str.get("source").str.get("display_name").fillna("")
         
         # Extract URL
-        url = work.get("doi", "") or work.get("id", "")
+        url = raw_doi.where(raw_doi != "", raw["id"].fillna(""))
         
-        # Extract PDF URL from locations
-        pdf_url = ""
-        if work.get("open_access", {}).get("oa_url"):
-            pdf_url = work["open_access"]["oa_url"]
-        elif work.get("best_oa_location", {}).get("pdf_url"):
-            pdf_url = work["best_oa_location"]["pdf_url"]
+        # Extract PDF URL
+        open_access = raw["open_access"]
+        oa_url = open_access.str.get("oa_url")
+        best_pdf_url = raw["best_oa_location"].str.get("pdf_url")
+        pdf_url = oa_url.where(oa_url.notna() & (oa_url != ""), best_pdf_url).fillna("")
         
         # Extract OA status
-        oa_status = "closed"
-        if work.get("open_access", {}).get("is_oa"):
-            oa_status = work.get("open_access", {}).get("oa_status", "unknown")
+        is_oa = open_access.str.get("is_oa").eq(True)
+        oa_status = open_access.str.get("oa_status").fillna("unknown").where(is_oa, "closed")
+        
+        # Rebuild the text from the inverted index when no plain abstract is given
+        abstract = raw["abstract"]
+        has_abstract = abstract.notna() & (abstract != "")
+        abstract = abstract.where(
+            has_abstract, raw["abstract_inverted_index"].map(abstract_from_inverted_index)
+        )
         
-        return {
+        return pd.DataFrame({
             "source": "openalex",
-            "id": work.get("id", ""),
+            "id": raw["id"].fillna(""),
             "doi": doi,
             "pmid": "",  # OpenAlex doesn't directly provide PMID
-            "title": work.get("title", ""),
-            "abstract": work.get("abstract", "") or work.get("abstract_inverted_index", ""),
-            "authors": authors_str,
+            "title": raw["title"].fillna(""),
+            "abstract": abstract.fillna(""),
+            "authors": authors,
             "journal": journal,
-            "year": work.get("publication_year"),
-            "doc_type": work.get("type", "").replace("https://openalex.org/", ""),
-            "lang": work.get("language", ""),
+            "year": pd.to_numeric(raw["publication_year"]),
+            "doc_type": raw["type"].fillna("").str.removeprefix("https://openalex.org/"),
+            "lang": raw["language"].fillna(""),
             "url": url,
             "pdf_url": pdf_url,
             "oa_status": oa_status,
-            "cited_by": work.get("cited_by_count", 0),
-        }
+            "cited_by": pd.to_numeric(raw["cited_by_count"]).fillna(0).astype("int64"),
+        })
+    
+    def fetch_page(
+        self,
+        url: str,
+        query: str,
+        page: int,
+        per_page: int,
+        pacer: RequestPacer
+    ) -> Dict:
+        """Fetch and log one page of OpenAlex results.
+        
+        Args:
+            url: Page URL
+            query: Search query string (for logging)
+            page: Page number (for logging)
+            per_page: Number of results per page (for logging)
+            pacer: Shared pacer keeping concurrent requests under the rate limit
+            
+        Returns:
+            Decoded JSON response
+        """
+        logger.info(f"Fetching page {page} from OpenAlex...")
+        
+        # Make rate-limited request
+        response = rate_limited_request(self.session, url, delay=pacer.reserve())
+        
+        data = parse_json_response(response)
+        
+        # Log API call
+        log_api_call(
+            logger,
+            "openalex",
+            url,
+            {"query": query, "page": page, "per_page": per_page},
+            {
+                "status": response.status_code,
+                "results": len(data.get("results", [])),
+                "total": data.get("meta", {}).get("count", 0)
+            }
+        )
+        return data
     
     def search_works(
         self,
@@ -156,6 +259,10 @@ class OpenAlexHarvester:
     ) -> pd.DataFrame:
         """Search for works in OpenAlex.
         
+        The first page gives the total result count; the remaining pages
+        are then fetched concurrently, paced to the OpenAlex rate limit, and
+        processed in page order.
+        
         Args:
             query: Search query string
             year_from: Start year for filtering
@@ -168,88 +275,77 @@ class OpenAlexHarvester:
         """
         logger.info(f"Starting OpenAlex search: '{query}' ({year_from}-{year_to})")
         
-        all_works = []
-        page = 1
+        page_frames = []
         total_retrieved = 0
         max_pages = max_results // per_page + 1
+        pacer = RequestPacer(self.rate_limit)
         
         # Prepare raw data storage
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        raw_file = config.data_dir / "raw" / f"openalex_{timestamp}.jsonl"
-        raw_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        while total_retrieved < max_results and page <= max_pages:
-            try:
-                # Build URL for this page
-                url = self.build_query_url(
-                    query=query,
-                    year_from=year_from,
-                    year_to=year_to,
-                    per_page=per_page,
-                    page=page
-                )
-                
-                logger.info(f"Fetching page {page} from OpenAlex...")
-                
-                # Make rate-limited request
-                response = rate_limited_request(
-                    self.session,
-                    url,
-                    delay=1.0 / self.rate_limit
-                )
-                
-                data = response.json()
-                
-                # Log API call
-                log_api_call(
-                    logger,
-                    "openalex",
-                    url,
-                    {"query": query, "page": page, "per_page": per_page},
-                    {
-                        "status": response.status_code,
-                        "results": len(data.get("results", [])),
-                        "total": data.get("meta", {}).get("count", 0)
-                    }
-                )
-                
-                # Parse results
-                works = data.get("results", [])
-                if not works:
-                    logger.info("No more results available")
+        raw_file = config.raw_dir / f"openalex_{timestamp}.jsonl.gz"
+        
+        # Only the page number changes from page to page
+        url_prefix = self.build_query_prefix(query, year_from, year_to, per_page)
+        
+        def request_page(page: int) -> Dict:
+            return self.fetch_page(f"{url_prefix}&page={page}", query, page, per_page, pacer)
+        
+        # Keep the raw file open for the whole search rather than once per page
+        with open_jsonl(raw_file, "a") as raw_fh, \
+                ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAGES) as executor:
+            pending = [(1, executor.submit(request_page, 1))]
+            
+            while pending:
+                page, future = pending.pop(0)
+                try:
+                    data = future.result()
+                    
+                    # Parse results
+                    works = data.get("results", [])
+                    if not works:
+                        logger.info("No more results available")
+                        break
+                    
+                    # The first page tells how many pages remain: request them all
+                    meta = data.get("meta", {})
+                    if page == 1:
+                        total = min(meta.get("count", 0), max_results)
+                        last_page = min(-(-total // per_page), max_pages)
+                        pending = [
+                            (next_page, executor.submit(request_page, next_page))
+                            for next_page in range(2, last_page + 1)
+                        ]
+                    
+                    # Save raw data
+                    write_jsonl(works, raw_fh)
+                    
+                    # Parse and add to collection
+                    page_frames.append(self.parse_works(works))
+                    
+                    total_retrieved += len(works)
+                    logger.info(f"Retrieved {total_retrieved} works so far")
+                    
+                    # Check if we've reached the end
+                    if total_retrieved >= max_results or page >= meta.get("count", 0) / per_page:
+                        break
+                    
+                except requests.RequestException as e:
+                    logger.error(f"Error fetching page {page}: {e}")
                     break
-                
-                # Save raw data
-                save_jsonl(works, raw_file, append=True)
-                
-                # Parse and add to collection
-                for work in works:
-                    parsed_work = self.parse_work(work)
-                    all_works.append(parsed_work)
-                
-                total_retrieved += len(works)
-                logger.info(f"Retrieved {total_retrieved} works so far")
-                
-                # Check if we've reached the end
-                meta = data.get("meta", {})
-                if page >= meta.get("count", 0) / per_page:
+                except Exception as e:
+                    logger.error(f"Unexpected error on page {page}: {e}")
                     break
-                
-                page += 1
-                
-            except requests.RequestException as e:
-                logger.error(f"Error fetching page {page}: {e}")
-                break
-            except Exception as e:
-                logger.error(f"Unexpected error on page {page}: {e}")
-                break
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(all_works)
+            
+            # Pages queued after a stop are not needed
+            for _, future in pending:
+                future.cancel()
+        
+        # Combine the parsed pages
+        df = pd.concat(page_frames, ignore_index=True) if page_frames else pd.DataFrame()
         
         # Save processed data
         if not df.empty:
-            processed_file = config.data_dir / "interim" / f"openalex_{timestamp}.csv"
+            processed_file = config.interim_dir / f"openalex_{timestamp}.parquet"
             save_dataframe(df, processed_file)
             logger.info(f"Saved {len(df)} works to {processed_file}")
         
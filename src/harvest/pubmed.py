@@ -5,27 +5,192 @@ from PubMed using the NCBI E-utilities API.
 """
 
 import logging
+import multiprocessing
+import os
 import time
 import xml.etree.ElementTree as ET
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
-from typing import Dict, List, Optional
-from urllib.parse import quote
+from functools import partial
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 import requests
-import xmltodict
 
 from ..config import config
 from ..utils_io import (
+    RequestPacer,
     log_api_call,
+    open_jsonl,
     rate_limited_request,
     save_dataframe,
-    save_jsonl,
     setup_session,
+    write_jsonl,
 )
 
 logger = logging.getLogger(__name__)
 
+# Records per EFetch request from the history server. NCBI accepts up to
+# 10000, but smaller batches keep responses a manageable size and leave
+# several batches to download and parse in parallel
+EFETCH_BATCH_SIZE = 500
+
+# EFetch batches requested in parallel; the pacer keeps them within the rate limit
+MAX_CONCURRENT_BATCHES = 3
+
+# Cached E-utilities responses are reused for this long; kept below the
+# lifetime of the history server WebEnv that cached EFetch URLs refer to
+CACHE_EXPIRE_SECONDS = 6 * 3600
+
+# Worker processes parsing downloaded batches off the GIL
+PARSE_WORKERS = min(MAX_CONCURRENT_BATCHES, os.cpu_count() or 1)
+
+
+def parse_article(article_elem: ET.Element) -> Dict:
+    """Parse a single article from PubMed XML.
+
+    Args:
+        article_elem: ``PubmedArticle`` element from the EFetch response
+
+    Returns:
+        Standardized work dictionary
+    """
+    try:
+        # Navigate the complex PubMed XML structure
+        medline_citation = article_elem.find("MedlineCitation")
+        article = medline_citation.find("Article")
+
+        # Extract PMID
+        pmid = medline_citation.findtext("PMID", "").strip()
+
+        # Extract title, keeping text inside inline markup such as <i>
+        title = ""
+        title_elem = article.find("ArticleTitle")
+        if title_elem is not None:
+            title = "".join(title_elem.itertext()).strip()
+
+        # Extract abstract, joining structured sections
+        abstract_parts = [
+            "".join(part.itertext()).strip()
+            for part in article.iterfind("Abstract/AbstractText")
+        ]
+        abstract = " ".join(part for part in abstract_parts if part)
+
+        # Extract authors
+        authors = []
+        for author in article.iterfind("AuthorList/Author"):
+            last_name = author.findtext("LastName", "")
+            fore_name = author.findtext("ForeName", "")
+            initials = author.findtext("Initials", "")
+
+            if last_name:
+                if fore_name:
+                    authors.append(f"{last_name}, {fore_name}")
+                elif initials:
+                    authors.append(f"{last_name}, {initials}")
+                else:
+                    authors.append(last_name)
+
+        authors_str = "; ".join(authors)
+
+        # Extract journal
+        journal = (
+            article.findtext("Journal/Title")
+            or article.findtext("Journal/ISOAbbreviation")
+            or ""
+        )
+
+        # Extract year, falling back to date ranges like "2023 Jan-Feb"
+        year = None
+        date_text = (
+            article.findtext("Journal/JournalIssue/PubDate/Year")
+            or article.findtext("Journal/JournalIssue/PubDate/MedlineDate", "")
+        )
+        try:
+            year = int(date_text.split()[0])
+        except (IndexError, ValueError):
+            pass
+
+        # Extract DOI
+        doi = article.findtext("ELocationID[@EIdType='doi']", "").strip()
+
+        # Build URL
+        url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/" if pmid else ""
+
+        # Extract publication types
+        doc_type = "journal-article"  # Default
+        for pub_type in article.iterfind("PublicationTypeList/PublicationType"):
+            pub_type_text = (pub_type.text or "").lower()
+            if "review" in pub_type_text:
+                doc_type = "review"
+            elif "case report" in pub_type_text:
+                doc_type = "case-report"
+            elif "editorial" in pub_type_text:
+                doc_type = "editorial"
+
+        return {
+            "source": "pubmed",
+            "id": pmid,
+            "doi": doi,
+            "pmid": pmid,
+            "title": title,
+            "abstract": abstract,
+            "authors": authors_str,
+            "journal": journal,
+            "year": year,
+            "doc_type": doc_type,
+            "lang": "",  # Language detection will be done later
+            "url": url,
+            "pdf_url": "",  # Will be enriched later
+            "oa_status": "unknown",  # Will be enriched later
+            "cited_by": 0,  # PubMed doesn't provide citation counts
+        }
+
+    except Exception as e:
+        logger.error(f"Error parsing article: {e}")
+        return {}
+
+
+def parse_efetch_xml(content: bytes) -> Tuple[List[Dict], Dict[str, List]]:
+    """Stream-parse an EFetch XML response.
+
+    Each ``PubmedArticle`` is parsed as soon as its end tag is read and
+    then cleared, so the full document tree is never held in memory. This
+    is a module-level function so batches can be parsed in worker processes;
+    works are returned column-wise, so field names are not repeated per
+    article when results are sent back.
+
+    Args:
+        content: Raw EFetch response body
+
+    Returns:
+        Tuple of raw article records (PMID and article XML) and work
+        fields as lists keyed by column, skipping articles that failed to
+        parse
+    """
+    raw_records = []
+    columns = defaultdict(list)
+
+    for _, elem in ET.iterparse(BytesIO(content)):
+        if elem.tag != "PubmedArticle":
+            continue
+
+        raw_records.append({
+            "pmid": elem.findtext("MedlineCitation/PMID", ""),
+            "xml": ET.tostring(elem, encoding="unicode")
+        })
+
+        article = parse_article(elem)
+        for name, value in article.items():
+            columns[name].append(value)
+
+        elem.clear()
+
+    return raw_records, dict(columns)
+
 
 class PubMedHarvester:
     """PubMed E-utilities API client for harvesting academic works."""
@@ -33,29 +198,39 @@ class PubMedHarvester:
     def __init__(self):
         """Initialize the PubMed harvester."""
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
-        self.session = setup_session()
+        self.search_url = f"{self.base_url}/esearch.fcgi"
+        self.fetch_url = f"{self.base_url}/efetch.fcgi"
+        self.session = setup_session(
+            pool_maxsize=MAX_CONCURRENT_BATCHES,
+            cache_name=config.cache_dir / "pubmed",
+            expire_after=CACHE_EXPIRE_SECONDS
+        )
         self.rate_limit = config.rate_limits["pubmed"]
+        self.pacer = RequestPacer(self.rate_limit)
         self.email = config.pubmed_email
+        self.api_key = config.pubmed_api_key
         
-    def build_search_url(
+    def build_search_params(
         self,
         query: str,
         year_from: int,
         year_to: int,
-        retmax: int = 200,
-        retstart: int = 0
-    ) -> str:
-        """Build PubMed ESearch URL.
+        retmax: int = 0
+    ) -> Dict[str, Any]:
+        """Build PubMed ESearch query parameters.
+        
+        The search is posted to the E-utilities history server, so the
+        matching PMIDs stay on the NCBI side and are fetched later via
+        ``WebEnv`` and ``query_key``.
         
         Args:
             query: Search query string
             year_from: Start year for filtering
             year_to: End year for filtering
-            retmax: Maximum number of results
-            retstart: Starting position
+            retmax: Number of PMIDs to include in the response
             
         Returns:
-            Complete search URL
+            Query parameters for the ESearch endpoint
         """
         # Add date range to query
         date_filter = f"AND ({year_from}[PDAT]:{year_to}[PDAT])"
@@ -65,314 +240,209 @@ class PubMedHarvester:
             "db": "pubmed",
             "term": full_query,
             "retmax": retmax,
-            "retstart": retstart,
+            "usehistory": "y",
             "retmode": "xml",
             "email": self.email,
             "tool": "lit-review-pipeline"
         }
+        if self.api_key:
+            params["api_key"] = self.api_key
         
-        param_string = "&".join([f"{k}={quote(str(v))}" for k, v in params.items()])
-        return f"{self.base_url}/esearch.fcgi?{param_string}"
+        return params
     
-    def build_fetch_url(self, pmids: List[str]) -> str:
-        """Build PubMed EFetch URL.
+    def build_fetch_params(
+        self,
+        webenv: str,
+        query_key: str,
+        retstart: int,
+        retmax: int = EFETCH_BATCH_SIZE
+    ) -> Dict[str, Any]:
+        """Build PubMed EFetch query parameters for a slice of a history server result.
         
         Args:
-            pmids: List of PubMed IDs
+            webenv: Web environment returned by ESearch
+            query_key: Query key returned by ESearch
+            retstart: Index of the first record to fetch
+            retmax: Number of records to fetch
             
         Returns:
-            Complete fetch URL
+            Query parameters for the EFetch endpoint
         """
-        id_string = ",".join(pmids)
         params = {
             "db": "pubmed",
-            "id": id_string,
+            "WebEnv": webenv,
+            "query_key": query_key,
+            "retstart": retstart,
+            "retmax": retmax,
             "retmode": "xml",
             "email": self.email,
             "tool": "lit-review-pipeline"
         }
+        if self.api_key:
+            params["api_key"] = self.api_key
         
-        param_string = "&".join([f"{k}={quote(str(v))}" for k, v in params.items()])
-        return f"{self.base_url}/efetch.fcgi?{param_string}"
+        return params
     
     def search_pmids(
         self,
         query: str,
         year_from: int,
-        year_to: int,
-        max_results: int = 2000
-    ) -> List[str]:
-        """Search for PMIDs using ESearch.
+        year_to: int
+    ) -> Tuple[str, str, int]:
+        """Run ESearch once, storing the matching PMIDs on the history server.
         
         Args:
             query: Search query string
             year_from: Start year for filtering
             year_to: End year for filtering
-            max_results: Maximum number of results
             
         Returns:
-            List of PubMed IDs
+            Tuple of ``WebEnv``, ``query_key`` and total match count; the
+            count is 0 if the search failed
         """
         logger.info(f"Searching PubMed for PMIDs: '{query}' ({year_from}-{year_to})")
         
-        all_pmids = []
-        retstart = 0
-        retmax = 200  # PubMed's recommended maximum
+        try:
+            params = self.build_search_params(query=query, year_from=year_from, year_to=year_to)
+            
+            # Make rate-limited request
+            response = rate_limited_request(
+                self.session,
+                self.search_url,
+                delay=self.pacer.reserve(),
+                params=params
+            )
+            
+            # Parse XML response
+            root = ET.fromstring(response.content)
+            webenv = root.findtext("WebEnv", "")
+            query_key = root.findtext("QueryKey", "")
+            total_count = int(root.findtext("Count", "0"))
+            
+        except Exception as e:
+            logger.error(f"Error searching PMIDs: {e}")
+            return "", "", 0
         
-        while len(all_pmids) < max_results:
-            try:
-                # Build search URL
-                url = self.build_search_url(
-                    query=query,
-                    year_from=year_from,
-                    year_to=year_to,
-                    retmax=min(retmax, max_results - len(all_pmids)),
-                    retstart=retstart
-                )
-                
-                logger.info(f"Fetching PMIDs starting at {retstart}...")
-                
-                # Make rate-limited request
-                response = rate_limited_request(
-                    self.session,
-                    url,
-                    delay=1.0 / self.rate_limit
-                )
-                
-                # Parse XML response
-                root = ET.fromstring(response.text)
-                pmids = [id_elem.text for id_elem in root.findall(".//Id")]
-                
-                if not pmids:
-                    logger.info("No more PMIDs available")
-                    break
-                
-                all_pmids.extend(pmids)
-                logger.info(f"Retrieved {len(all_pmids)} PMIDs so far")
-                
-                # Check if we've reached the end
-                count_elem = root.find(".//Count")
-                total_count = int(count_elem.text) if count_elem is not None else 0
-                
-                if retstart + retmax >= total_count:
-                    break
-                
-                retstart += retmax
-                
-            except Exception as e:
-                logger.error(f"Error searching PMIDs: {e}")
-                break
+        if not webenv or not query_key:
+            logger.error("PubMed search did not return a history server WebEnv")
+            return "", "", 0
         
-        logger.info(f"PubMed search completed: {len(all_pmids)} PMIDs found")
-        return all_pmids
+        logger.info(f"PubMed search completed: {total_count} PMIDs found")
+        return webenv, query_key, total_count
     
-    def parse_article(self, article_dict: Dict) -> Dict:
-        """Parse a single article from PubMed XML.
+    def fetch_batch(
+        self,
+        webenv: str,
+        query_key: str,
+        retstart: int,
+        retmax: int
+    ) -> bytes:
+        """Fetch one EFetch batch from the history server.
         
         Args:
-            article_dict: Article data from XML (converted to dict)
+            webenv: Web environment returned by ESearch
+            query_key: Query key returned by ESearch
+            retstart: Index of the first record in the batch
+            retmax: Number of records in the batch
             
         Returns:
-            Standardized work dictionary
+            Raw EFetch XML response body
         """
-        try:
-            # Navigate the complex PubMed XML structure
-            medline_citation = article_dict.get("MedlineCitation", {})
-            article = medline_citation.get("Article", {})
-            
-            # Extract PMID
-            pmid = str(medline_citation.get("PMID", {}).get("#text", ""))
-            
-            # Extract title
-            title = ""
-            if article.get("ArticleTitle"):
-                title_data = article["ArticleTitle"]
-                if isinstance(title_data, dict):
-                    title = title_data.get("#text", "")
-                else:
-                    title = str(title_data)
-            
-            # Extract abstract
-            abstract = ""
-            if article.get("Abstract", {}).get("AbstractText"):
-                abstract_data = article["Abstract"]["AbstractText"]
-                if isinstance(abstract_data, list):
-                    abstract_parts = []
-                    for part in abstract_data:
-                        if isinstance(part, dict):
-                            abstract_parts.append(part.get("#text", ""))
-                        else:
-                            abstract_parts.append(str(part))
-                    abstract = " ".join(abstract_parts)
-                elif isinstance(abstract_data, dict):
-                    abstract = abstract_data.get("#text", "")
-                else:
-                    abstract = str(abstract_data)
-            
-            # Extract authors
-            authors = []
-            author_list = article.get("AuthorList", {}).get("Author", [])
-            if not isinstance(author_list, list):
-                author_list = [author_list]
-            
-            for author in author_list:
-                if isinstance(author, dict):
-                    last_name = author.get("LastName", "")
-                    fore_name = author.get("ForeName", "")
-                    initials = author.get("Initials", "")
-                    
-                    if last_name:
-                        if fore_name:
-                            authors.append(f"{last_name}, {fore_name}")
-                        elif initials:
-                            authors.append(f"{last_name}, {initials}")
-                        else:
-                            authors.append(last_name)
-            
-            authors_str = "; ".join(authors)
-            
-            # Extract journal
-            journal = ""
-            journal_data = article.get("Journal", {})
-            if journal_data.get("Title"):
-                journal = journal_data["Title"]
-            elif journal_data.get("ISOAbbreviation"):
-                journal = journal_data["ISOAbbreviation"]
-            
-            # Extract year
-            year = None
-            pub_date = article.get("Journal", {}).get("JournalIssue", {}).get("PubDate", {})
-            if pub_date.get("Year"):
-                year = int(pub_date["Year"])
-            elif pub_date.get("MedlineDate"):
-                # Handle date ranges like "2023 Jan-Feb"
-                medline_date = pub_date["MedlineDate"]
-                try:
-                    year = int(medline_date.split()[0])
-                except (IndexError, ValueError):
-                    pass
-            
-            # Extract DOI
-            doi = ""
-            article_ids = medline_citation.get("Article", {}).get("ELocationID", [])
-            if not isinstance(article_ids, list):
-                article_ids = [article_ids]
-            
-            for article_id in article_ids:
-                if isinstance(article_id, dict) and article_id.get("@EIdType") == "doi":
-                    doi = article_id.get("#text", "")
-                    break
-            
-            # Build URL
-            url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/" if pmid else ""
-            
-            # Extract publication types
-            pub_types = article.get("PublicationTypeList", {}).get("PublicationType", [])
-            if not isinstance(pub_types, list):
-                pub_types = [pub_types]
-            
-            doc_type = "journal-article"  # Default
-            for pub_type in pub_types:
-                if isinstance(pub_type, dict):
-                    pub_type_text = pub_type.get("#text", "").lower()
-                    if "review" in pub_type_text:
-                        doc_type = "review"
-                    elif "case report" in pub_type_text:
-                        doc_type = "case-report"
-                    elif "editorial" in pub_type_text:
-                        doc_type = "editorial"
-            
-            return {
-                "source": "pubmed",
-                "id": pmid,
-                "doi": doi,
-                "pmid": pmid,
-                "title": title,
-                "abstract": abstract,
-                "authors": authors_str,
-                "journal": journal,
-                "year": year,
-                "doc_type": doc_type,
-                "lang": "",  # Language detection will be done later
-                "url": url,
-                "pdf_url": "",  # Will be enriched later
-                "oa_status": "unknown",  # Will be enriched later
-                "cited_by": 0,  # PubMed doesn't provide citation counts
-            }
-            
-        except Exception as e:
-            logger.error(f"Error parsing article: {e}")
-            return {}
+        # Build fetch parameters
+        params = self.build_fetch_params(webenv, query_key, retstart, retmax)
+        
+        # Make rate-limited request
+        response = rate_limited_request(
+            self.session,
+            self.fetch_url,
+            delay=self.pacer.reserve(),
+            params=params
+        )
+        
+        # Log API call
+        log_api_call(
+            logger,
+            "pubmed",
+            self.fetch_url,
+            {"retstart": retstart, "retmax": retmax},
+            {"status": response.status_code, "bytes": len(response.content)}
+        )
+        
+        return response.content
     
-    def fetch_articles(self, pmids: List[str]) -> List[Dict]:
-        """Fetch full article data using EFetch.
+    def fetch_articles(self, webenv: str, query_key: str, total: int) -> Dict[str, List]:
+        """Fetch full article data for a history server result using EFetch.
+        
+        Batches are downloaded concurrently, paced to the PubMed rate limit,
+        then parsed in worker processes while later batches download, and
+        processed in order. A single batch has no downloads to overlap with
+        and is parsed inline, sparing the cost of spawning workers.
         
         Args:
-            pmids: List of PubMed IDs
+            webenv: Web environment returned by ESearch
+            query_key: Query key returned by ESearch
+            total: Number of records to fetch from the start of the result
             
         Returns:
-            List of parsed article dictionaries
+            Parsed work fields as lists keyed by column
         """
-        logger.info(f"Fetching {len(pmids)} articles from PubMed...")
+        logger.info(f"Fetching {total} articles from PubMed...")
         
-        articles = []
-        batch_size = 200  # Process in batches to avoid timeout
+        columns = defaultdict(list)
+        batch_starts = range(0, total, EFETCH_BATCH_SIZE)
         
         # Prepare raw data storage
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        raw_file = config.data_dir / "raw" / f"pubmed_{timestamp}.jsonl"
-        raw_file.parent.mkdir(parents=True, exist_ok=True)
+        raw_file = config.raw_dir / f"pubmed_{timestamp}.jsonl.gz"
         
-        for i in range(0, len(pmids), batch_size):
-            batch_pmids = pmids[i:i + batch_size]
+        with open_jsonl(raw_file, "a") as raw_fh, \
+                ThreadPoolExecutor(max_workers=MAX_CONCURRENT_BATCHES) as executor, \
+                ExitStack() as stack:
+            parse_executor = None
+            if len(batch_starts) > 1:
+                # Spawn rather than fork: the download threads are already running
+                parse_executor = stack.enter_context(ProcessPoolExecutor(
+                    max_workers=PARSE_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn")
+                ))
             
-            try:
-                # Build fetch URL
-                url = self.build_fetch_url(batch_pmids)
-                
-                logger.info(f"Fetching batch {i//batch_size + 1}/{(len(pmids)-1)//batch_size + 1}...")
-                
-                # Make rate-limited request
-                response = rate_limited_request(
-                    self.session,
-                    url,
-                    delay=1.0 / self.rate_limit
-                )
-                
-                # Parse XML to dict
-                xml_dict = xmltodict.parse(response.text)
-                
-                # Extract articles
-                pubmed_data = xml_dict.get("PubmedArticleSet", {})
-                pubmed_articles = pubmed_data.get("PubmedArticle", [])
-                
-                if not isinstance(pubmed_articles, list):
-                    pubmed_articles = [pubmed_articles]
-                
-                # Save raw data
-                save_jsonl(pubmed_articles, raw_file, append=True)
-                
-                # Parse articles
-                for article_data in pubmed_articles:
-                    parsed_article = self.parse_article(article_data)
-                    if parsed_article:
-                        articles.append(parsed_article)
-                
-                # Log API call
-                log_api_call(
-                    logger,
-                    "pubmed",
-                    url,
-                    {"pmids_count": len(batch_pmids)},
-                    {"status": response.status_code, "articles": len(pubmed_articles)}
+            futures = [
+                executor.submit(
+                    self.fetch_batch, webenv, query_key, i, min(EFETCH_BATCH_SIZE, total - i)
                 )
-                
-            except Exception as e:
-                logger.error(f"Error fetching batch starting at {i}: {e}")
-                continue
+                for i in batch_starts
+            ]
+            
+            # Hand each batch to a parser process as soon as it is downloaded
+            parses = []
+            for i, future in zip(batch_starts, futures):
+                try:
+                    content = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching batch starting at {i}: {e}")
+                    continue
+                if parse_executor is None:
+                    parses.append((i, partial(parse_efetch_xml, content)))
+                else:
+                    parses.append((i, parse_executor.submit(parse_efetch_xml, content).result))
+            
+            for batch_number, (i, parse) in enumerate(parses, start=1):
+                try:
+                    raw_records, batch_columns = parse()
+                    logger.info(f"Fetched batch {batch_number}/{len(futures)}")
+                    
+                    # Save raw data
+                    write_jsonl(raw_records, raw_fh)
+                    
+                    for name, values in batch_columns.items():
+                        columns[name].extend(values)
+                    
+                except Exception as e:
+                    logger.error(f"Error parsing batch starting at {i}: {e}")
+                    continue
         
-        logger.info(f"Fetched {len(articles)} articles from PubMed")
-        return articles
+        logger.info(f"Fetched {len(columns['id'])} articles from PubMed")
+        return dict(columns)
     
     def search_and_fetch(
         self,
@@ -392,23 +462,26 @@ class PubMedHarvester:
         Returns:
             DataFrame with standardized work data
         """
-        # Step 1: Search for PMIDs
-        pmids = self.search_pmids(query, year_from, year_to, max_results)
+        # Step 1: Search for PMIDs, keeping them on the history server
+        webenv, query_key, total_count = self.search_pmids(query, year_from, year_to)
         
-        if not pmids:
+        if not total_count:
             logger.warning("No PMIDs found")
             return pd.DataFrame()
         
         # Step 2: Fetch full article data
-        articles = self.fetch_articles(pmids)
+        columns = self.fetch_articles(webenv, query_key, min(total_count, max_results))
         
-        # Convert to DataFrame
-        df = pd.DataFrame(articles)
+        # Build the DataFrame straight from the columns, with compact numeric dtypes
+        df = pd.DataFrame(columns)
+        if not df.empty:
+            df["year"] = pd.array(columns["year"], dtype="Int16")
+            df["cited_by"] = df["cited_by"].astype("int32")
         
         # Save processed data
         if not df.empty:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            processed_file = config.data_dir / "interim" / f"pubmed_{timestamp}.csv"
+            processed_file = config.interim_dir / f"pubmed_{timestamp}.csv"
             save_dataframe(df, processed_file)
             logger.info(f"Saved {len(df)} works to {processed_file}")
         
@@ -6,6 +6,7 @@ from Scopus using their API.
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
 from urllib.parse import quote
@@ -15,15 +16,21 @@ import requests
 
 from ..config import config
 from ..utils_io import (
+    RequestPacer,
     log_api_call,
+    open_jsonl,
+    parse_json_response,
     rate_limited_request,
     save_dataframe,
-    save_jsonl,
     setup_session,
+    write_jsonl,
 )
 
 logger = logging.getLogger(__name__)
 
+# Pages requested in parallel once the total result count is known
+MAX_CONCURRENT_PAGES = 2
+
 
 class ScopusHarvester:
     """Scopus API client for harvesting academic works."""
@@ -35,8 +42,9 @@ class ScopusHarvester:
             api_key: Scopus API key (optional, can be set in config)
         """
         self.base_url = "https://api.elsevier.com/content/search/scopus"
-        self.session = setup_session()
+        self.session = setup_session(pool_maxsize=MAX_CONCURRENT_PAGES)
         self.rate_limit = 2  # Scopus allows 2 requests per second
+        self.pacer = RequestPacer(self.rate_limit)
         self.api_key = api_key or getattr(config, 'scopus_api_key', '')
         
         if not self.api_key:
@@ -50,6 +58,62 @@ class ScopusHarvester:
             "User-Agent": "LitReviewPipeline/1.0"
         })
     
+    def fetch_page(
+        self,
+        query: str,
+        year_from: int,
+        year_to: int,
+        start: int,
+        count: int
+    ) -> Dict:
+        """Fetch one page of Scopus search results.
+        
+        Args:
+            query: Search query string
+            year_from: Start year for filtering
+            year_to: End year for filtering
+            start: Index of the first result
+            count: Number of results to request
+            
+        Returns:
+            Decoded JSON response
+        """
+        # Build search parameters
+        params = {
+            "query": f"{query} AND PUBYEAR > {year_from-1} AND PUBYEAR < {year_to+1}",
+            "start": start,
+            "count": count,
+            "field": "doi,title,creator,publicationName,coverDate,abstract,citedby-count,openaccess,eid,prism:issn",
+            "sort": "relevancy"
+        }
+        
+        logger.info(f"Fetching Scopus results starting at {start}...")
+        
+        # Make rate-limited request
+        response = rate_limited_request(
+            self.session,
+            self.base_url,
+            delay=self.pacer.reserve(),
+            params=params
+        )
+        
+        data = parse_json_response(response)
+        
+        # Log API call
+        search_results = data.get("search-results", {})
+        log_api_call(
+            logger,
+            "scopus",
+            self.base_url,
+            params,
+            {
+                "status": response.status_code,
+                "results": len(search_results.get("entry", [])),
+                "total": int(search_results.get("opensearch:totalResults", 0))
+            }
+        )
+        return data
+    
     def search_works(
         self,
         query: str,
@@ -60,6 +124,10 @@ class ScopusHarvester:
     ) -> pd.DataFrame:
         """Search for works in Scopus.
         
+        The first page gives the total result count; the remaining pages
+        are then fetched concurrently, paced to the Scopus rate limit, and
+        processed in order.
+        
         Args:
             query: Search query string
             year_from: Start year for filtering
@@ -77,93 +145,76 @@ class ScopusHarvester:
         logger.info(f"Starting Scopus search: '{query}' ({year_from}-{year_to})")
         
         all_works = []
-        start = 0
         
         # Prepare raw data storage
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        raw_file = config.data_dir / "raw" / f"scopus_{timestamp}.jsonl"
-        raw_file.parent.mkdir(parents=True, exist_ok=True)
+        raw_file = config.raw_dir / f"scopus_{timestamp}.jsonl.gz"
         
-        while start < max_results:
-            try:
-                # Build search parameters
-                params = {
-                    "query": f"{query} AND PUBYEAR > {year_from-1} AND PUBYEAR < {year_to+1}",
-                    "start": start,
-                    "count": min(count, max_results - start),
-                    "field": "doi,title,creator,publicationName,coverDate,abstract,citedby-count,openaccess,eid,prism:issn",
-                    "sort": "relevancy"
-                }
-                
-                logger.info(f"Fetching Scopus results starting at {start}...")
-                
-                # Make rate-limited request
-                response = rate_limited_request(
-                    self.session,
-                    self.base_url,
-                    delay=1.0 / self.rate_limit,
-                    params=params
-                )
-                
-                data = response.json()
-                
-                # Check for errors
-                if "search-results" not in data:
-                    error_msg = data.get("error-response", {}).get("error-message", "Unknown error")
-                    logger.error(f"Scopus API error: {error_msg}")
-                    break
-                
-                search_results = data["search-results"]
-                entries = search_results.get("entry", [])
-                
-                if not entries:
-                    logger.info("No more results available")
+        def request_page(start: int) -> Dict:
+            return self.fetch_page(
+                query, year_from, year_to, start, min(count, max_results - start)
+            )
+        
+        with open_jsonl(raw_file, "a") as raw_fh, \
+                ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAGES) as executor:
+            pending = [(0, executor.submit(request_page, 0))]
+            
+            while pending:
+                start, future = pending.pop(0)
+                try:
+                    data = future.result()
+                    
+                    # Check for errors
+                    if "search-results" not in data:
+                        error_msg = data.get("error-response", {}).get("error-message", "Unknown error")
+                        logger.error(f"Scopus API error: {error_msg}")
+                        break
+                    
+                    search_results = data["search-results"]
+                    entries = search_results.get("entry", [])
+                    
+                    if not entries:
+                        logger.info("No more results available")
+                        break
+                    
+                    # The first page tells how many pages remain: request them all
+                    total_results = int(search_results.get("opensearch:totalResults", 0))
+                    if start == 0:
+                        pending = [
+                            (next_start, executor.submit(request_page, next_start))
+                            for next_start in range(count, min(total_results, max_results), count)
+                        ]
+                    
+                    # Save raw data
+                    write_jsonl(entries, raw_fh)
+                    
+                    # Parse and add to collection, skipping entries that failed to parse
+                    parsed_works = [self.parse_work(entry) for entry in entries]
+                    all_works.extend(work for work in parsed_works if work)
+                    
+                    logger.info(f"Retrieved {len(all_works)} works so far")
+                    
+                    # Check if we've reached the end
+                    if len(entries) < count or start + count >= total_results:
+                        break
+                    
+                except requests.RequestException as e:
+                    logger.error(f"Error fetching from Scopus: {e}")
                     break
-                
-                # Log API call
-                total_results = int(search_results.get("opensearch:totalResults", 0))
-                log_api_call(
-                    logger,
-                    "scopus",
-                    self.base_url,
-                    params,
-                    {
-                        "status": response.status_code,
-                        "results": len(entries),
-                        "total": total_results
-                    }
-                )
-                
-                # Save raw data
-                save_jsonl(entries, raw_file, append=True)
-                
-                # Parse and add to collection
-                for entry in entries:
-                    parsed_work = self.parse_work(entry)
-                    if parsed_work:
-                        all_works.append(parsed_work)
-                
-                logger.info(f"Retrieved {len(all_works)} works so far")
-                
-                # Check if we've reached the end
-                if len(entries) < count or start + count >= total_results:
+                except Exception as e:
+                    logger.error(f"Unexpected error: {e}")
                     break
-                
-                start += count
-                
-            except requests.RequestException as e:
-                logger.error(f"Error fetching from Scopus: {e}")
-                break
-            except Exception as e:
-                logger.error(f"Unexpected error: {e}")
-                break
+            
+            # Pages queued after a stop are not needed
+            for _, future in pending:
+                future.cancel()
         
         # Convert to DataFrame
         df = pd.DataFrame(all_works)
         
         # Save processed data
         if not df.empty:
-            processed_file = config.data_dir / "interim" / f"scopus_{timestamp}.csv"
+            processed_file = config.interim_dir / f"scopus_{timestamp}.csv"
             save_dataframe(df, processed_file)
             logger.info(f"Saved {len(df)} works to {processed_file}")
         
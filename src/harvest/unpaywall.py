@@ -12,7 +12,7 @@ import pandas as pd
 import requests
 
 from ..config import config
-from ..utils_io import log_api_call, rate_limited_request, setup_session
+from ..utils_io import RequestPacer, log_api_call, rate_limited_request, setup_session
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +25,7 @@ class UnpaywallEnricher:
         self.base_url = "https://api.unpaywall.org/v2"
         self.session = setup_session()
         self.rate_limit = config.rate_limits["unpaywall"]
+        self.pacer = RequestPacer(self.rate_limit)
         self.email = config.unpaywall_email
         
         if not self.email:
@@ -44,7 +45,7 @@ class UnpaywallEnricher:
         
         try:
             # Clean DOI
-            clean_doi = doi.strip().replace("https://doi.org/", "")
+            clean_doi = doi.strip().removeprefix("https://doi.org/")
             
             # Build URL
             url = f"{self.base_url}/{clean_doi}?email={self.email}"
@@ -53,7 +54,7 @@ class UnpaywallEnricher:
             response = rate_limited_request(
                 self.session,
                 url,
-                delay=1.0 / self.rate_limit
+                delay=self.pacer.reserve()
             )
             
             data = response.json()
@@ -167,6 +168,9 @@ class UnpaywallEnricher:
         dois = enriched_df[doi_column].dropna().unique()
         logger.info(f"Processing {len(dois)} unique DOIs...")
         
+        # Collect parsed results per DOI, then write them back in one aligned pass
+        # instead of scanning the whole DOI column once per DOI
+        results = {}
         for i in range(0, len(dois), batch_size):
             batch_dois = dois[i:i + batch_size]
             logger.info(f"Processing batch {i//batch_size + 1}/{(len(dois)-1)//batch_size + 1}")
@@ -175,22 +179,33 @@ class UnpaywallEnricher:
                 # Get Unpaywall data
                 oa_data = self.get_oa_info(doi)
                 parsed_oa = self.parse_oa_info(oa_data)
-                
-                # Update rows with this DOI
-                mask = enriched_df[doi_column] == doi
-                enriched_df.loc[mask, "is_oa"] = parsed_oa["is_oa"]
-                enriched_df.loc[mask, "unpaywall_pdf_url"] = parsed_oa["pdf_url"]
-                enriched_df.loc[mask, "oa_locations_count"] = len(parsed_oa["oa_locations"])
-                
-                # Update existing oa_status if it was unknown
-                if "oa_status" in enriched_df.columns:
-                    unknown_mask = mask & (enriched_df["oa_status"].isin(["unknown", "", pd.NA]))
-                    enriched_df.loc[unknown_mask, "oa_status"] = parsed_oa["oa_status"]
-                
-                # Update existing pdf_url if empty
-                if "pdf_url" in enriched_df.columns:
-                    empty_pdf_mask = mask & (enriched_df["pdf_url"].isin(["", pd.NA]))
-                    enriched_df.loc[empty_pdf_mask, "pdf_url"] = parsed_oa["pdf_url"]
+                results[doi] = {
+                    "is_oa": parsed_oa["is_oa"],
+                    "oa_status": parsed_oa["oa_status"],
+                    "pdf_url": parsed_oa["pdf_url"],
+                    "oa_locations_count": len(parsed_oa["oa_locations"]),
+                }
+        
+        if results:
+            oa_by_doi = pd.DataFrame.from_dict(results, orient="index")
+            matched = enriched_df[doi_column].isin(oa_by_doi.index)
+            looked_up = oa_by_doi.reindex(enriched_df.loc[matched, doi_column])
+            looked_up.index = enriched_df.index[matched]
+            
+            # Update rows with a looked-up DOI
+            enriched_df.loc[matched, "is_oa"] = looked_up["is_oa"]
+            enriched_df.loc[matched, "unpaywall_pdf_url"] = looked_up["pdf_url"]
+            enriched_df.loc[matched, "oa_locations_count"] = looked_up["oa_locations_count"]
+            
+            # Update existing oa_status if it was unknown
+            if "oa_status" in enriched_df.columns:
+                unknown_mask = matched & (enriched_df["oa_status"].isin(["unknown", "", pd.NA]))
+                enriched_df.loc[unknown_mask, "oa_status"] = looked_up["oa_status"]
+            
+            # Update existing pdf_url if empty
+            if "pdf_url" in enriched_df.columns:
+                empty_pdf_mask = matched & (enriched_df["pdf_url"].isin(["", pd.NA]))
+                enriched_df.loc[empty_pdf_mask, "pdf_url"] = looked_up["pdf_url"]
         
         # Log results
         oa_count = enriched_df["is_oa"].sum()
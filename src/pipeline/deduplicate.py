@@ -61,12 +61,12 @@ class Deduplicator:
         
         # Check ID duplicates (for same source)
         if 'id' in df.columns and 'source' in df.columns:
-            for source in df['source'].unique():
-                source_df = df[df['source'] == source]
-                id_groups = source_df[source_df['id'].notna() & (source_df['id'] != "")].groupby('id').groups
-                for id_val, indices in id_groups.items():
-                    if len(indices) > 1:
-                        duplicate_groups[f"id:{source}:{id_val}"] = indices.tolist()
+            # One grouped pass over (source, id) instead of re-filtering per source
+            has_id = df['id'].notna() & (df['id'] != "")
+            id_groups = df[has_id].groupby(['source', 'id'], observed=True).groups
+            for (source, id_val), indices in id_groups.items():
+                if len(indices) > 1:
+                    duplicate_groups[f"id:{source}:{id_val}"] = indices.tolist()
         
         return duplicate_groups
     
@@ -227,8 +227,8 @@ class Deduplicator:
             except (ValueError, TypeError):
                 pass
         
-        # Calculate similarity
-        ratio = int(SequenceMatcher(None, title1, title2).ratio() * 100)
+        if title1 == title2:
+            return True
         
         # Use different thresholds based on title length
         if len(title1) < 30 or len(title2) < 30:
@@ -238,6 +238,17 @@ class Deduplicator:
             # Standard threshold for longer titles
             threshold = self.title_threshold * 100
         
+        # real_quick_ratio() and quick_ratio() are cheap upper bounds on
+        # ratio(): most non-matching pairs are rejected before the full diff
+        matcher = SequenceMatcher(None, title1, title2)
+        if int(matcher.real_quick_ratio() * 100) < threshold:
+            return False
+        if int(matcher.quick_ratio() * 100) < threshold:
+            return False
+        
+        # Calculate similarity
+        ratio = int(matcher.ratio() * 100)
+        
         return ratio >= threshold
     
     def find_fuzzy_duplicates(self, df: pd.DataFrame) -> Dict[str, List[int]]:
@@ -262,8 +273,20 @@ class Deduplicator:
             logger.info("No title blocks created, no fuzzy duplicates found")
             return {}
         
-        duplicate_groups = {}
-        group_counter = 0
+        # Plain dict lookups instead of a df.loc row fetch for every pair
+        titles = df['title_normalized'].to_dict()
+        years = df['year'].to_dict() if 'year' in df.columns else {}
+        
+        # Union-find over matched pairs: groups are the connected components,
+        # so a paper matching two existing groups merges them
+        parent = {}
+        
+        def find(idx):
+            root = parent.setdefault(idx, idx)
+            while root != parent[root]:
+                parent[root] = parent[parent[root]]
+                root = parent[root]
+            return root
         
         for block_key, indices in blocks.items():
             logger.debug(f"Processing block '{block_key}' with {len(indices)} papers")
@@ -271,30 +294,23 @@ class Deduplicator:
             # Compare all pairs within this block
             for i, idx1 in enumerate(indices):
                 for idx2 in indices[i+1:]:
-                    row1 = df.loc[idx1]
-                    row2 = df.loc[idx2]
-                    
-                    title1 = row1.get('title_normalized', '')
-                    title2 = row2.get('title_normalized', '')
-                    year1 = row1.get('year')
-                    year2 = row2.get('year')
+                    root1, root2 = find(idx1), find(idx2)
+                    if root1 == root2:
+                        continue  # Already grouped through another match
                     
-                    if self.are_titles_similar(title1, title2, year1, year2):
-                        # Find existing group or create new one
-                        existing_group = None
-                        for group_id, group_indices in duplicate_groups.items():
-                            if idx1 in group_indices or idx2 in group_indices:
-                                existing_group = group_id
-                                break
-                        
-                        if existing_group:
-                            # Add to existing group
-                            duplicate_groups[existing_group].extend([idx1, idx2])
-                            duplicate_groups[existing_group] = list(set(duplicate_groups[existing_group]))
-                        else:
-                            # Create new group
-                            group_counter += 1
-                            duplicate_groups[f"fuzzy_group_{group_counter}"] = [idx1, idx2]
+                    if self.are_titles_similar(
+                        titles[idx1], titles[idx2], years.get(idx1), years.get(idx2)
+                    ):
+                        parent[root2] = root1
+        
+        components = {}
+        for idx in parent:
+            components.setdefault(find(idx), []).append(idx)
+        
+        duplicate_groups = {}
+        for indices in components.values():
+            if len(indices) > 1:
+                duplicate_groups[f"fuzzy_group_{len(duplicate_groups) + 1}"] = sorted(indices)
         
         logger.info(f"Found {len(duplicate_groups)} groups of fuzzy duplicates")
         return duplicate_groups
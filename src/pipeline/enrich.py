@@ -13,7 +13,7 @@ import requests
 
 from ..config import config
 from ..harvest.unpaywall import UnpaywallEnricher
-from ..utils_io import log_api_call, rate_limited_request, setup_session
+from ..utils_io import RequestPacer, log_api_call, rate_limited_request, setup_session
 
 logger = logging.getLogger(__name__)
 
@@ -21,10 +21,17 @@ logger = logging.getLogger(__name__)
 class MetadataEnricher:
     """Engine for enriching paper metadata from various sources."""
     
+    # DOIs per Crossref filter query; keeps the request URI well under size limits
+    CROSSREF_DOI_BATCH_SIZE = 50
+    
+    # Crossref date fields holding the publication year, in order of preference
+    CROSSREF_YEAR_FIELDS = ("published-print", "published-online")
+    
     def __init__(self):
         """Initialize the enricher."""
         self.unpaywall = UnpaywallEnricher()
         self.crossref_session = setup_session()
+        self.crossref_pacer = RequestPacer(config.rate_limits["crossref"])
         self.crossref_session.headers.update({
             "User-Agent": f"LitReviewPipeline/1.0 (mailto:{config.crossref_mailto or 'example@example.com'})",
         })
@@ -70,64 +77,50 @@ class MetadataEnricher:
         dois_to_enrich = enriched_df[needs_enrichment]['doi'].unique()
         logger.info(f"Found {len(dois_to_enrich)} papers needing Crossref enrichment")
         
-        for doi in dois_to_enrich:
+        # Look DOIs up in batches through the works filter instead of one GET per DOI
+        batch_size = self.CROSSREF_DOI_BATCH_SIZE
+        url = "https://api.crossref.org/works"
+        for i in range(0, len(dois_to_enrich), batch_size):
+            batch = list(dois_to_enrich[i:i + batch_size])
             try:
-                # Query Crossref
-                url = f"https://api.crossref.org/works/{doi}"
+                params = {
+                    "filter": ",".join(f"doi:{doi}" for doi in batch),
+                    "rows": len(batch),
+                }
                 response = rate_limited_request(
                     self.crossref_session,
                     url,
-                    delay=1.0 / config.rate_limits["crossref"]
+                    delay=self.crossref_pacer.reserve(),
+                    params=params
                 )
                 
                 data = response.json()
-                work = data.get("message", {})
-                
-                # Update rows with this DOI
-                mask = enriched_df['doi'] == doi
-                
-                # Journal
-                if work.get("container-title") and enriched_df.loc[mask, 'journal'].isna().any():
-                    journal = work["container-title"][0] if isinstance(work["container-title"], list) else work["container-title"]
-                    enriched_df.loc[mask & (enriched_df['journal'].isna() | (enriched_df['journal'] == "")), 'journal'] = journal
-                
-                # Year
-                if work.get("published-print", {}).get("date-parts") and enriched_df.loc[mask, 'year'].isna().any():
-                    year = work["published-print"]["date-parts"][0][0]
-                    enriched_df.loc[mask & enriched_df['year'].isna(), 'year'] = year
-                elif work.get("published-online", {}).get("date-parts") and enriched_df.loc[mask, 'year'].isna().any():
-                    year = work["published-online"]["date-parts"][0][0]
-                    enriched_df.loc[mask & enriched_df['year'].isna(), 'year'] = year
+                items = data.get("message", {}).get("items", [])
+                works_by_doi = {
+                    item["DOI"].lower(): item for item in items if item.get("DOI")
+                }
                 
-                # Publisher
-                if work.get("publisher"):
-                    if 'publisher' not in enriched_df.columns:
-                        enriched_df['publisher'] = ""
-                    enriched_df.loc[mask, 'publisher'] = work["publisher"]
-                
-                # ISSN
-                if work.get("ISSN"):
-                    if 'issn' not in enriched_df.columns:
-                        enriched_df['issn'] = ""
-                    issn = work["ISSN"][0] if isinstance(work["ISSN"], list) else work["ISSN"]
-                    enriched_df.loc[mask, 'issn'] = issn
-                
-                crossref_count += 1
+                for doi in batch:
+                    work = works_by_doi.get(str(doi).lower())
+                    if work is None:
+                        continue
+                    self._apply_crossref_work(enriched_df, doi, work)
+                    crossref_count += 1
                 
                 # Log API call
                 log_api_call(
                     logger,
                     "crossref_enrich",
                     url,
-                    {"doi": doi},
-                    {"status": response.status_code, "enriched": True}
+                    {"dois": len(batch)},
+                    {"status": response.status_code, "items": len(items)}
                 )
                 
             except requests.RequestException as e:
-                logger.debug(f"Error enriching DOI {doi} with Crossref: {e}")
+                logger.debug(f"Error enriching DOI batch with Crossref: {e}")
                 continue
             except Exception as e:
-                logger.error(f"Unexpected error enriching DOI {doi}: {e}")
+                logger.error(f"Unexpected error enriching DOI batch: {e}")
                 continue
         
         self.metrics["crossref_enriched"] = crossref_count
@@ -135,6 +128,46 @@ class MetadataEnricher:
         
         return enriched_df
     
+    def _apply_crossref_work(self, enriched_df: pd.DataFrame, doi: str, work: Dict) -> None:
+        """Fill missing metadata for rows matching a DOI from a Crossref work.
+        
+        Args:
+            enriched_df: DataFrame updated in place
+            doi: DOI of the rows to update
+            work: Crossref work record
+        """
+        mask = enriched_df['doi'] == doi
+        
+        # Journal
+        if work.get("container-title") and enriched_df.loc[mask, 'journal'].isna().any():
+            journal = work["container-title"][0] if isinstance(work["container-title"], list) else work["container-title"]
+            enriched_df.loc[mask & (enriched_df['journal'].isna() | (enriched_df['journal'] == "")), 'journal'] = journal
+        
+        # Year, from the first date field present
+        year = next(
+            (
+                work[field]["date-parts"][0][0]
+                for field in self.CROSSREF_YEAR_FIELDS
+                if field in work and work[field].get("date-parts")
+            ),
+            None
+        )
+        if year is not None and enriched_df.loc[mask, 'year'].isna().any():
+            enriched_df.loc[mask & enriched_df['year'].isna(), 'year'] = year
+        
+        # Publisher
+        if work.get("publisher"):
+            if 'publisher' not in enriched_df.columns:
+                enriched_df['publisher'] = ""
+            enriched_df.loc[mask, 'publisher'] = work["publisher"]
+        
+        # ISSN
+        if work.get("ISSN"):
+            if 'issn' not in enriched_df.columns:
+                enriched_df['issn'] = ""
+            issn = work["ISSN"][0] if isinstance(work["ISSN"], list) else work["ISSN"]
+            enriched_df.loc[mask, 'issn'] = issn
+    
     def enrich_with_unpaywall(self, df: pd.DataFrame) -> pd.DataFrame:
         """Enrich with open access information from Unpaywall.
         
@@ -218,20 +251,21 @@ class MetadataEnricher:
             'cited_by': 1,   # Nice to have
         }
         
-        scores = []
         max_score = sum(fields_weights.values())
         
-        for _, row in enriched_df.iterrows():
-            score = 0
-            for field, weight in fields_weights.items():
-                if field in row and row[field] and not pd.isna(row[field]) and str(row[field]).strip() != "":
-                    score += weight
-            
-            # Normalize to 0-100 scale
-            normalized_score = (score / max_score) * 100
-            scores.append(normalized_score)
-        
-        enriched_df['metadata_completeness'] = scores
+        # Score whole columns at once rather than looping over rows
+        score = pd.Series(0, index=enriched_df.index)
+        for field, weight in fields_weights.items():
+            if field not in enriched_df.columns:
+                continue
+            values = enriched_df[field]
+            values = values.where(values.notna(), "")
+            # A field counts when it is truthy and not blank once stringified
+            filled = values.astype(bool) & (values.astype(str).str.strip() != "")
+            score += filled.astype(int) * weight
+        
+        # Normalize to 0-100 scale
+        enriched_df['metadata_completeness'] = (score / max_score) * 100
         
         return enriched_df
     
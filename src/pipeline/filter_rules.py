@@ -52,7 +52,8 @@ class FilterEngine:
                 (df['lang'] == "") |
                 df['lang'].str.lower().isin(allowed_langs)
             )
-            filtered_df = df[mask].copy()
+            # Boolean indexing already returns a new frame; no extra copy needed
+            filtered_df = df[mask]
             
             excluded_count = before_count - len(filtered_df)
             self.metrics["excluded_by_rule"]["language"] = excluded_count
@@ -89,23 +90,26 @@ class FilterEngine:
             return df
         
         before_count = len(df)
-        filtered_df = df.copy()
+        doc_types = df['doc_type'].str.lower()
+        
+        # Accumulate both conditions into one mask and slice once
+        mask = pd.Series(True, index=df.index)
         
         # Apply allowed types filter
         if allowed_types:
             allowed_types = [t.lower().strip() for t in allowed_types]
-            mask = (
-                filtered_df['doc_type'].isna() |
-                (filtered_df['doc_type'] == "") |
-                filtered_df['doc_type'].str.lower().isin(allowed_types)
+            mask &= (
+                df['doc_type'].isna() |
+                (df['doc_type'] == "") |
+                doc_types.isin(allowed_types)
             )
-            filtered_df = filtered_df[mask]
         
         # Apply excluded types filter
         if excluded_types:
             excluded_types = [t.lower().strip() for t in excluded_types]
-            mask = ~filtered_df['doc_type'].str.lower().isin(excluded_types)
-            filtered_df = filtered_df[mask]
+            mask &= ~doc_types.isin(excluded_types)
+        
+        filtered_df = df[mask]
         
         excluded_count = before_count - len(filtered_df)
         if excluded_count > 0:
@@ -149,21 +153,23 @@ class FilterEngine:
             return df
         
         before_count = len(df)
-        filtered_df = df.copy()
         
         # Convert year column to numeric, errors to NaN
-        filtered_df['year'] = pd.to_numeric(filtered_df['year'], errors='coerce')
+        years = pd.to_numeric(df['year'], errors='coerce')
+        
+        # Papers with a missing year are always kept
+        mask = years.isna()
+        in_range = pd.Series(True, index=df.index)
         
         # Apply year filters
         if year_from is not None:
-            # Include papers with missing year or year >= year_from
-            mask = filtered_df['year'].isna() | (filtered_df['year'] >= year_from)
-            filtered_df = filtered_df[mask]
+            in_range &= years >= year_from
         
         if year_to is not None:
-            # Include papers with missing year or year <= year_to
-            mask = filtered_df['year'].isna() | (filtered_df['year'] <= year_to)
-            filtered_df = filtered_df[mask]
+            in_range &= years <= year_to
+        
+        mask |= in_range
+        filtered_df = df[mask].assign(year=years[mask])
         
         excluded_count = before_count - len(filtered_df)
         if excluded_count > 0:
@@ -197,7 +203,7 @@ class FilterEngine:
         # Exclude preprints
         preprint_types = ['preprint', 'posted-content']
         mask = ~df['doc_type'].str.lower().isin(preprint_types)
-        filtered_df = df[mask].copy()
+        filtered_df = df[mask]
         
         excluded_count = before_count - len(filtered_df)
         if excluded_count > 0:
@@ -244,7 +250,7 @@ class FilterEngine:
             )
         )
         
-        filtered_df = df[mask].copy()
+        filtered_df = df[mask]
         
         excluded_count = before_count - len(filtered_df)
         if excluded_count > 0:
@@ -276,7 +282,7 @@ class FilterEngine:
         # - Author requirements
         # etc.
         
-        filtered_df = df.copy()
+        filtered_df = df
         
         # Example: minimum citation count
         if 'min_citations' in custom_rules:
@@ -345,7 +351,9 @@ class FilterEngine:
             self.metrics["final_count"] = 0
             return df, self.metrics
         
-        filtered_df = df.copy()
+        # Filters slice with boolean masks, which already yield new frames,
+        # so the input is not copied up front
+        filtered_df = df
         
         # Apply filters in sequence
         if langs:
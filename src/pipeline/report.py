@@ -71,6 +71,8 @@ class ReportGenerator:
         # By source
         if 'source' in self.df.columns:
             source_counts = self.df['source'].value_counts()
+            # Categorical sources also report unused categories with a zero count
+            source_counts = source_counts[source_counts > 0]
             stats['papers_by_source'] = source_counts.to_dict()
             stats['primary_source'] = source_counts.idxmax()
             stats['primary_source_count'] = source_counts.max()
@@ -84,18 +86,19 @@ class ReportGenerator:
         
         # By journal
         if 'journal' in self.df.columns:
-            journal_counts = self.df['journal'].value_counts().head(10)
-            stats['top_journals'] = journal_counts.to_dict()
-            stats['unique_journals'] = self.df['journal'].nunique()
+            journal_counts = self.df['journal'].value_counts()
+            stats['top_journals'] = journal_counts.head(10).to_dict()
+            # value_counts drops NA like nunique, so reuse it instead of rescanning
+            stats['unique_journals'] = len(journal_counts)
         
         # Open access
         if 'oa_status' in self.df.columns:
             oa_counts = self.df['oa_status'].value_counts()
             stats['papers_by_oa_status'] = oa_counts.to_dict()
             
-            open_access_papers = self.df[self.df['oa_status'].isin(['gold', 'green', 'hybrid'])]
-            stats['open_access_count'] = len(open_access_papers)
-            stats['open_access_percentage'] = (len(open_access_papers) / len(self.df)) * 100
+            open_access_count = int(oa_counts.reindex(['gold', 'green', 'hybrid'], fill_value=0).sum())
+            stats['open_access_count'] = open_access_count
+            stats['open_access_percentage'] = (open_access_count / len(self.df)) * 100
         
         # Languages
         if 'lang' in self.df.columns:
@@ -104,11 +107,11 @@ class ReportGenerator:
         
         # Citations
         if 'cited_by' in self.df.columns:
-            citations = self.df['cited_by'].fillna(0)
-            stats['total_citations'] = citations.sum()
-            stats['avg_citations'] = citations.mean()
-            stats['median_citations'] = citations.median()
-            stats['max_citations'] = citations.max()
+            citation_stats = self.df['cited_by'].fillna(0).agg(['sum', 'mean', 'median', 'max'])
+            stats['total_citations'] = citation_stats['sum']
+            stats['avg_citations'] = citation_stats['mean']
+            stats['median_citations'] = citation_stats['median']
+            stats['max_citations'] = citation_stats['max']
             
             # Most cited papers
             most_cited = self.df.nlargest(5, 'cited_by')[['title', 'cited_by', 'authors']]
@@ -116,18 +119,18 @@ class ReportGenerator:
         
         # Authors
         if 'authors' in self.df.columns:
-            all_authors = []
+            # Count directly into a running Counter instead of building a flat list first
+            author_counts = Counter()
             for authors_str in self.df['authors'].fillna(''):
                 if authors_str:
                     # Split and clean author names
-                    authors = [a.strip() for a in authors_str.split(';') if a.strip()]
-                    all_authors.extend(authors)
+                    author_counts.update(a.strip() for a in authors_str.split(';') if a.strip())
             
-            if all_authors:
-                author_counts = Counter(all_authors)
+            if author_counts:
+                total_author_instances = sum(author_counts.values())
                 stats['unique_authors'] = len(author_counts)
-                stats['total_author_instances'] = len(all_authors)
-                stats['avg_authors_per_paper'] = len(all_authors) / len(self.df)
+                stats['total_author_instances'] = total_author_instances
+                stats['avg_authors_per_paper'] = total_author_instances / len(self.df)
                 
                 # Most prolific authors
                 top_authors = dict(author_counts.most_common(10))
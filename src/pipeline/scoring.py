@@ -12,6 +12,7 @@ from __future__ import annotations
 import logging
 import pickle
 from collections import Counter
+from itertools import chain
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -47,13 +48,12 @@ class ScreeningModel:
 
     def prepare_text_features(self, df: pd.DataFrame) -> pd.Series:
         """Combine title and abstract into a single text feature."""
-        text_features = []
-        for _, row in df.iterrows():
-            title = str(row.get("title", "")).strip()
-            abstract = str(row.get("abstract", "")).strip()
-            combined_text = f"{title} {title} {abstract}"  # emphasise title
-            text_features.append(combined_text)
-        return pd.Series(text_features)
+        # Column-wise string ops instead of building each row from a Series
+        empty = pd.Series("", index=df.index)
+        title = df["title"].astype(str).str.strip() if "title" in df.columns else empty
+        abstract = df["abstract"].astype(str).str.strip() if "abstract" in df.columns else empty
+        text_features = title + " " + title + " " + abstract  # emphasise title
+        return text_features.reset_index(drop=True)
 
     @staticmethod
     def _tokenize(text: str) -> List[str]:
@@ -95,19 +95,26 @@ class ScreeningModel:
             raise ValueError("Model must be trained before making predictions")
 
         features = self.prepare_text_features(df)
-        predictions: List[int] = []
-        probabilities: List[float] = []
-
-        for text in features:
-            tokens = self._tokenize(text)
-            pos = sum(self.pos_counts[t] for t in tokens)
-            neg = sum(self.neg_counts[t] for t in tokens)
-            total = pos + neg
-            prob = pos / total if total else 0.5
-            probabilities.append(prob)
-            predictions.append(1 if prob >= 0.5 else 0)
-
-        return np.array(predictions), np.array(probabilities)
+        tokens = features.str.lower().str.split()
+
+        # Score all tokens at once: look up every token's counts in a single
+        # reindex, then sum them back per paper with bincount
+        flat_tokens = list(chain.from_iterable(tokens))
+        row_ids = np.repeat(np.arange(len(tokens)), tokens.str.len().to_numpy())
+        vocab = pd.DataFrame(
+            {
+                "pos": pd.Series(self.pos_counts, dtype=float),
+                "neg": pd.Series(self.neg_counts, dtype=float),
+            }
+        ).fillna(0.0)
+        counts = vocab.reindex(flat_tokens, fill_value=0.0)
+        pos = np.bincount(row_ids, weights=counts["pos"].to_numpy(), minlength=len(tokens))
+        neg = np.bincount(row_ids, weights=counts["neg"].to_numpy(), minlength=len(tokens))
+
+        total = pos + neg
+        probabilities = np.divide(pos, total, out=np.full(len(tokens), 0.5), where=total > 0)
+        predictions = (probabilities >= 0.5).astype(int)
+        return predictions, probabilities
 
     def get_feature_importance(self, top_n: int = 20) -> List[Tuple[str, float]]:
         if not self.is_trained:
@@ -147,6 +154,13 @@ class ScreeningModel:
 # ---------------------------------------------------------------------------
 
 
+def _text_rows(df: pd.DataFrame):
+    """Iterate (title, abstract) tuples, with '' for a missing column."""
+    return df.reindex(columns=["title", "abstract"], fill_value="").itertuples(
+        index=False, name=None
+    )
+
+
 class QueryBasedScorer:
     """Score papers based on lexical overlap with a query."""
 
@@ -162,8 +176,8 @@ class QueryBasedScorer:
             return np.array([]), np.array([])
 
         similarities: List[float] = []
-        for _, row in df.iterrows():
-            text = f"{row.get('title', '')} {row.get('abstract', '')}"
+        for title, abstract in _text_rows(df):
+            text = f"{title} {abstract}"
             tokens = self._tokenize(text)
             if not tokens or not self.query_tokens:
                 sim = 0.0
@@ -216,10 +230,9 @@ class PaperScorer:
         if self.use_trained_model:
             important_features = [feat[0] for feat in self.model.get_feature_importance(10)]
 
-        for i, (pred, prob) in enumerate(zip(predictions, probabilities)):
-            row = df.iloc[i]
-            title = str(row.get("title", "")).lower()
-            abstract = str(row.get("abstract", "")).lower()
+        for (title, abstract), pred, prob in zip(_text_rows(df), predictions, probabilities):
+            title = str(title).lower()
+            abstract = str(abstract).lower()
 
             if pred == 1:
                 reason = "High relevance score" if prob > 0.6 else "Low relevance score"
@@ -269,6 +282,9 @@ def score_papers(df: pd.DataFrame, query: str = "") -> pd.DataFrame:
 
 
 def prepare_screening_excel(df: pd.DataFrame, output_path: Path) -> None:
+    from openpyxl import Workbook
+    from openpyxl.utils import get_column_letter
+
     if df.empty:
         logger.warning("No data to export to Excel")
         return
@@ -280,21 +296,22 @@ def prepare_screening_excel(df: pd.DataFrame, output_path: Path) -> None:
         screening_df = screening_df.sort_values("confidence", ascending=False)
     screening_df.reset_index(drop=True, inplace=True)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-        screening_df.to_excel(writer, sheet_name="Papers to Screen", index=False)
-        workbook = writer.book
-        worksheet = writer.sheets["Papers to Screen"]
-        for column in worksheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except Exception:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            worksheet.column_dimensions[column_letter].width = adjusted_width
+
+    # Stream rows through a write-only workbook instead of the pandas writer,
+    # which materialises every cell in memory before saving
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet("Papers to Screen")
+    for idx, column in enumerate(screening_df.columns, start=1):
+        lengths = screening_df[column].astype(str).str.len()
+        max_length = max(len(str(column)), int(lengths.max()) if len(lengths) else 0)
+        # Column widths must be set before the first row is written
+        worksheet.column_dimensions[get_column_letter(idx)].width = min(max_length + 2, 50)
+
+    worksheet.append(list(screening_df.columns))
+    cells = screening_df.astype(object).where(screening_df.notna(), None)
+    for row in cells.itertuples(index=False, name=None):
+        worksheet.append(row)
+    workbook.save(output_path)
     logger.info(f"Screening Excel file saved to {output_path}")
 
 
@@ -7,12 +7,16 @@ This module provides common utilities for:
 - HTTP request utilities with retry logic
 """
 
+import gzip
 import json
 import logging
+import os
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, TextIO, Union
 
+import numpy as np
 import pandas as pd
 import requests
 from requests.adapters import HTTPAdapter
@@ -20,18 +24,43 @@ from urllib3.util.retry import Retry
 
 from .config import config
 
+try:
+    import orjson
+except ImportError:
+    # orjson not available, fall back to the standard library decoder
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:
+    # requests-cache not available, sessions always go to the network
+    requests_cache = None
+
 
 def setup_session(
     max_retries: int = 3,
     backoff_factor: float = 1.0,
     status_forcelist: Optional[List[int]] = None,
+    pool_maxsize: int = 10,
+    cache_name: Optional[Union[str, Path]] = None,
+    expire_after: int = 86400,
 ) -> requests.Session:
     """Create a requests session with retry strategy.
     
+    The session keeps connections alive, so repeated requests to the same
+    host reuse an open TLS connection instead of reconnecting. When
+    ``cache_name`` is given and requests-cache is installed, successful GET
+    responses are also cached in a SQLite file keyed by URL and parameters.
+    
     Args:
         max_retries: Maximum number of retries
         backoff_factor: Backoff factor for exponential backoff
         status_forcelist: List of HTTP status codes to retry on
+        pool_maxsize: Connections kept open per host; match it to the
+            number of threads sharing the session
+        cache_name: Path of the SQLite response cache, or None to disable
+            caching
+        expire_after: Seconds before a cached response is refetched
         
     Returns:
         Configured requests Session
@@ -39,7 +68,15 @@ def setup_session(
     if status_forcelist is None:
         status_forcelist = [429, 500, 502, 503, 504]
     
-    session = requests.Session()
+    if cache_name is not None and requests_cache is not None:
+        session = requests_cache.CachedSession(
+            cache_name=str(cache_name),
+            backend="sqlite",
+            expire_after=expire_after,
+            allowable_methods=("GET",),
+        )
+    else:
+        session = requests.Session()
     
     retry_strategy = Retry(
         total=max_retries,
@@ -49,7 +86,7 @@ def setup_session(
         status_forcelist=status_forcelist,
     )
     
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=pool_maxsize)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     
@@ -82,6 +119,89 @@ def rate_limited_request(
     return response
 
 
+def parse_json_response(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed.
+    
+    Args:
+        response: Response whose body is JSON
+        
+    Returns:
+        Decoded JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+class RequestPacer:
+    """Spread requests evenly over a rate limit, from one or several threads.
+    
+    Each call to :meth:`reserve` books the next free slot and returns how
+    long the caller must wait for it, which can be passed as the ``delay``
+    of :func:`rate_limited_request`. Time already spent since the previous
+    slot counts towards the interval, so a slow response is not followed by
+    a full extra sleep.
+    """
+    
+    def __init__(self, rate_limit: float):
+        """Initialize the pacer.
+        
+        Args:
+            rate_limit: Maximum number of requests per second
+        """
+        self.interval = 1.0 / rate_limit
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Book the next request slot.
+        
+        Returns:
+            Seconds to wait before sending the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+            return slot - now
+
+
+def open_jsonl(filepath: Path, mode: str = "r") -> TextIO:
+    """Open a JSON Lines file in text mode, gzip-compressed if it ends in ``.gz``.
+    
+    Args:
+        filepath: Path to the file
+        mode: ``"r"``, ``"w"`` or ``"a"``
+        
+    Returns:
+        Open text file handle
+    """
+    if filepath.suffix == ".gz":
+        # A low level keeps compression cheap; JSON still shrinks several-fold
+        return gzip.open(filepath, mode + "t", compresslevel=3, encoding="utf-8")
+    return open(filepath, mode, encoding="utf-8")
+
+
+def write_jsonl(data: List[Dict[str, Any]], file: TextIO) -> None:
+    """Write records as JSON Lines to an already open text file.
+    
+    Lets a caller keep one handle open across many batches instead of
+    reopening the file for each one. Records are encoded with orjson when
+    it is installed, so they must be plain JSON-decoded data.
+    
+    Args:
+        data: List of dictionaries to write
+        file: Open text file handle
+    """
+    # Serialize the batch once and hand the file a single write per batch
+    if orjson is not None:
+        file.write(
+            b"".join(orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE) for item in data).decode("utf-8")
+        )
+    else:
+        file.write("".join(json.dumps(item, ensure_ascii=False) + "\n" for item in data))
+
+
 def save_jsonl(data: List[Dict[str, Any]], filepath: Path, append: bool = False) -> None:
     """Save data as JSON Lines format.
     
@@ -91,9 +211,8 @@ def save_jsonl(data: List[Dict[str, Any]], filepath: Path, append: bool = False)
         append: Whether to append to existing file
     """
     mode = "a" if append else "w"
-    with open(filepath, mode, encoding="utf-8") as f:
-        for item in data:
-            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+    with open_jsonl(filepath, mode) as f:
+        write_jsonl(data, f)
 
 
 def load_jsonl(filepath: Path) -> List[Dict[str, Any]]:
@@ -107,7 +226,7 @@ def load_jsonl(filepath: Path) -> List[Dict[str, Any]]:
     """
     data = []
     if filepath.exists():
-        with open(filepath, "r", encoding="utf-8") as f:
+        with open_jsonl(filepath) as f:
             for line in f:
                 if line.strip():
                     data.append(json.loads(line))
@@ -125,7 +244,7 @@ def save_dataframe(
     Args:
         df: DataFrame to save
         filepath: Output file path
-        format_type: File format ('csv', 'xlsx', 'json'). If None, infer from extension
+        format_type: File format ('csv', 'xlsx', 'json', 'parquet'). If None, infer from extension
         **kwargs: Additional arguments for pandas save methods
     """
     if format_type is None:
@@ -139,6 +258,9 @@ def save_dataframe(
         df.to_excel(filepath, index=False, **kwargs)
     elif format_type == "json":
         df.to_json(filepath, orient="records", **kwargs)
+    elif format_type == "parquet":
+        kwargs.setdefault("compression", "zstd")
+        df.to_parquet(filepath, index=False, **kwargs)
     else:
         raise ValueError(f"Unsupported format: {format_type}")
 
@@ -146,13 +268,16 @@ def save_dataframe(
 def load_dataframe(
     filepath: Path,
     format_type: Optional[str] = None,
+    columns: Optional[List[str]] = None,
     **kwargs
 ) -> pd.DataFrame:
     """Load DataFrame from various formats.
     
     Args:
         filepath: Input file path
-        format_type: File format ('csv', 'xlsx', 'json'). If None, infer from extension
+        format_type: File format ('csv', 'xlsx', 'json', 'parquet'). If None, infer from extension
+        columns: Optional list of columns to read (CSV, Excel and Parquet);
+            names missing from the file are ignored
         **kwargs: Additional arguments for pandas load methods
         
     Returns:
@@ -164,16 +289,72 @@ def load_dataframe(
     if format_type is None:
         format_type = filepath.suffix.lower()[1:]  # Remove the dot
     
+    if columns is not None:
+        # Skip unwanted columns while parsing rather than dropping them afterwards
+        wanted = set(columns)
+        if format_type in ("csv", "xlsx"):
+            kwargs["usecols"] = lambda col: col in wanted
+        elif format_type == "parquet":
+            import pyarrow.parquet as pq
+            
+            available = set(pq.read_schema(filepath).names)
+            kwargs["columns"] = [col for col in columns if col in available]
+    
     if format_type == "csv":
         return pd.read_csv(filepath, **kwargs)
     elif format_type == "xlsx":
         return pd.read_excel(filepath, **kwargs)
     elif format_type == "json":
         return pd.read_json(filepath, **kwargs)
+    elif format_type == "parquet":
+        return pd.read_parquet(filepath, **kwargs)
     else:
         raise ValueError(f"Unsupported format: {format_type}")
 
 
+def optimize_dtypes(
+    df: pd.DataFrame,
+    category_columns: Optional[List[str]] = None,
+    integer_columns: Optional[List[str]] = None,
+    string_columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """Shrink low-cardinality, integer and free-text columns to compact dtypes.
+    
+    Categorical columns compare and group on integer codes instead of Python
+    strings. Only apply this once a column's values are final: assigning a
+    value that is not already a category raises. Text columns become
+    Arrow-backed strings; missing values are then ``pd.NA``, which is not
+    usable in a boolean context.
+    
+    Args:
+        df: DataFrame to optimize
+        category_columns: Columns to convert to 'category'
+        integer_columns: Numeric columns to downcast to the smallest integer type
+        string_columns: Text columns to convert to 'string[pyarrow]'
+        
+    Returns:
+        DataFrame with converted dtypes (the input is not modified)
+    """
+    optimized_df = df.copy()
+    
+    for col in category_columns or []:
+        if col in optimized_df.columns:
+            optimized_df[col] = optimized_df[col].astype("category")
+    
+    for col in integer_columns or []:
+        if col in optimized_df.columns:
+            # Columns with missing values stay float; downcast is a no-op then
+            optimized_df[col] = pd.to_numeric(
+                optimized_df[col], errors="coerce", downcast="integer"
+            )
+    
+    for col in string_columns or []:
+        if col in optimized_df.columns:
+            optimized_df[col] = optimized_df[col].astype("string[pyarrow]")
+    
+    return optimized_df
+
+
 def log_api_call(
     logger: logging.Logger,
     api_name: str,
@@ -190,6 +371,10 @@ def log_api_call(
         params: Request parameters
         response_info: Response information (status, count, etc.)
     """
+    # Skip building the message when INFO records would be dropped anyway
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     log_data = {
         "api": api_name,
         "endpoint": endpoint,
@@ -230,6 +415,38 @@ def get_timestamp() -> str:
     return time.strftime("%Y%m%d_%H%M%S")
 
 
+def find_latest_file(
+    directory: Path,
+    prefix: str,
+    suffixes: tuple = (".parquet", ".csv")
+) -> Optional[Path]:
+    """Find the most recently modified stage output in a directory.
+    
+    Args:
+        directory: Directory to search
+        prefix: File name prefix, e.g. 'processed_papers_'
+        suffixes: Accepted extensions; CSV is kept for runs written before
+            stage outputs moved to Parquet
+        
+    Returns:
+        Path of the newest matching file, or None if there is none
+    """
+    if not directory.is_dir():
+        return None
+    # scandir entries carry their own stat cache: one directory walk,
+    # no fnmatch pattern per suffix
+    with os.scandir(directory) as entries:
+        files = [
+            entry for entry in entries
+            if entry.name.startswith(prefix)
+            and entry.name.endswith(suffixes)
+            and entry.is_file()
+        ]
+    if not files:
+        return None
+    return Path(max(files, key=lambda e: e.stat().st_mtime).path)
+
+
 def clean_filename(filename: str) -> str:
     """Clean filename by removing invalid characters.
     
@@ -247,13 +464,16 @@ def clean_filename(filename: str) -> str:
 
 def merge_dataframes(
     dataframes: List[pd.DataFrame],
-    source_names: Optional[List[str]] = None
+    source_names: Optional[List[str]] = None,
+    columns: Optional[List[str]] = None
 ) -> pd.DataFrame:
     """Merge multiple DataFrames with source tracking.
     
     Args:
         dataframes: List of DataFrames to merge
         source_names: Optional list of source names to add to each DataFrame
+        columns: Optional canonical column list; each frame is projected onto
+            it before concatenation so pandas skips the column-union path
         
     Returns:
         Merged DataFrame
@@ -261,27 +481,31 @@ def merge_dataframes(
     if not dataframes:
         return pd.DataFrame()
     
-    if source_names and len(source_names) == len(dataframes):
-        for df, source in zip(dataframes, source_names):
-            if not df.empty and "source" not in df.columns:
-                df["source"] = source
-    
-    # Ensure all DataFrames have the same columns
-    all_columns = set()
-    for df in dataframes:
-        all_columns.update(df.columns)
+    if not (source_names and len(source_names) == len(dataframes)):
+        source_names = [None] * len(dataframes)
     
-    standardized_dfs = []
-    for df in dataframes:
+    # Source labels are collected per frame and written once after the concat,
+    # instead of copying every input frame just to add a constant column
+    frames = []
+    labels = []
+    tag_source = False
+    for df, source in zip(dataframes, source_names):
         if df.empty:
             continue
-        # Add missing columns with NaN values
-        for col in all_columns:
-            if col not in df.columns:
-                df[col] = pd.NA
-        standardized_dfs.append(df)
+        if "source" in df.columns:
+            labels.append(df["source"].to_numpy(dtype=object))
+        else:
+            labels.append(np.full(len(df), source, dtype=object))
+            tag_source = tag_source or source is not None
+        if columns is not None:
+            df = df.reindex(columns=columns)
+        frames.append(df)
     
-    if not standardized_dfs:
+    if not frames:
         return pd.DataFrame()
     
-    return pd.concat(standardized_dfs, ignore_index=True)
+    # concat aligns on the union of columns, filling missing ones with NaN
+    merged = pd.concat(frames, ignore_index=True)
+    if tag_source and (columns is None or "source" in columns):
+        merged["source"] = np.concatenate(labels)
+    return merged
@@ -15,7 +15,7 @@ import pandas as pd
 import requests
 
 from ..config import config
-from ..utils_io import log_api_call, rate_limited_request, setup_session
+from ..utils_io import RequestPacer, log_api_call, rate_limited_request, setup_session
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +30,7 @@ class ZoteroClient:
         self.base_url = "https://api.zotero.org"
         self.session = setup_session()
         self.rate_limit = config.rate_limits["zotero"]
+        self.pacer = RequestPacer(self.rate_limit)
         
         if not self.user_id or not self.api_key:
             logger.warning("Zotero credentials not configured. Integration will be disabled.")
@@ -57,7 +58,7 @@ class ZoteroClient:
             response = rate_limited_request(
                 self.session,
                 url,
-                delay=1.0 / self.rate_limit,
+                delay=self.pacer.reserve(),
                 params=params
             )
             
@@ -83,7 +84,7 @@ class ZoteroClient:
             response = rate_limited_request(
                 self.session,
                 url,
-                delay=1.0 / self.rate_limit
+                delay=self.pacer.reserve()
             )
             
             collections = response.json()
@@ -285,6 +286,10 @@ class ZoteroClient:
         # Process in batches (Zotero API limit is 50 items per request)
         batch_size = 50
         
+        # Tags shared by every item are built once instead of once per paper
+        user_tags = [{"tag": tag} for tag in tags] if tags else []
+        import_tag = {"tag": f"imported-{datetime.now().strftime('%Y-%m-%d')}"}
+        
         for i in range(0, len(papers), batch_size):
             batch_papers = papers[i:i + batch_size]
             
@@ -300,33 +305,30 @@ class ZoteroClient:
                     
                     # Add tags
                     if tags:
-                        item_data["tags"] = [{"tag": tag} for tag in tags]
-                    
-                    # Add processing metadata as tags
-                    processing_tags = [
-                        f"imported-{datetime.now().strftime('%Y-%m-%d')}",
-                        f"source-{paper.get('source', 'unknown')}"
-                    ]
+                        item_data["tags"] = list(user_tags)
                     
                     if "tags" not in item_data:
                         item_data["tags"] = []
                     
-                    for tag in processing_tags:
-                        item_data["tags"].append({"tag": tag})
+                    # Add processing metadata as tags
+                    item_data["tags"].append(import_tag)
+                    item_data["tags"].append({"tag": f"source-{paper.get('source', 'unknown')}"})
                     
                     items_data.append(item_data)
                 
                 # Send batch to Zotero
                 url = f"{self.base_url}/users/{self.user_id}/items"
                 
+                # Paced from the previous request, so the time spent building a
+                # batch and waiting on the response counts towards the rate limit
+                time.sleep(self.pacer.reserve())
+                
                 response = self.session.post(
                     url,
                     data=json.dumps(items_data),
                     headers={"Content-Type": "application/json"}
                 )
                 
-                time.sleep(1.0 / self.rate_limit)  # Rate limiting
-                
                 if response.status_code == 200:
                     batch_result = response.json()
                     
@@ -384,14 +386,13 @@ class ZoteroClient:
             
             url = f"{self.base_url}/users/{self.user_id}/items"
             
+            time.sleep(self.pacer.reserve())  # Rate limiting
             response = self.session.post(
                 url,
                 data=json.dumps([attachment_data]),
                 headers={"Content-Type": "application/json"}
             )
             
-            time.sleep(1.0 / self.rate_limit)  # Rate limiting
-            
             if response.status_code == 200:
                 result = response.json()
                 if result.get("successful"):
@@ -438,8 +439,9 @@ class ZoteroClient:
             logger.error(error_msg)
             return {"successful": 0, "failed": 0, "errors": [error_msg]}
         
-        # Convert DataFrame to list of dictionaries
-        papers = df.to_dict('records')
+        # Convert DataFrame to list of dictionaries; missing values (NaN or
+        # pd.NA from Arrow-backed columns) become None so field checks stay falsy
+        papers = df.astype(object).where(df.notna(), None).to_dict('records')
         
         # Add items to collection
         results = self.add_items_to_collection(papers, collection_key, tags)
@@ -0,0 +1,72 @@
+"""Tests for the pure helpers of the Streamlit screening app."""
+
+import ast
+import io
+from pathlib import Path
+
+import pytest
+import pandas as pd
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app" / "advanced_research_app.py"
+
+
+def load_app_function(name, namespace=None):
+    """Load one top-level function from the app without running the script.
+
+    Importing the app module would start the Streamlit page and connect to
+    the database, so only the requested function definition is executed,
+    without its Streamlit decorators, against the given module globals.
+    """
+    tree = ast.parse(APP_PATH.read_text(encoding="utf-8"))
+    node = next(
+        n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name == name
+    )
+    node.decorator_list = []
+    namespace = dict(namespace or {})
+    exec(compile(ast.Module(body=[node], type_ignores=[]), str(APP_PATH), "exec"), namespace)
+    return namespace[name]
+
+
+class TestTriageProgress:
+    """Test cases for the triage progress display."""
+
+    def test_progress_advances_after_vote(self):
+        """Test that the count follows votes while the triage index stays put."""
+        triage_progress = load_app_function("triage_progress")
+        df = pd.DataFrame({'title': ['A', 'B', 'C'], 'vote_status': ['pending'] * 3})
+
+        pending = df.index[df["vote_status"] == "pending"]
+        assert triage_progress(len(df), len(pending)) == (1, pytest.approx(1 / 3))
+
+        # The voted row leaves the pending list; the index stays at 0
+        df.at[pending[0], "vote_status"] = "include"
+        pending = df.index[df["vote_status"] == "pending"]
+
+        assert triage_progress(len(df), len(pending)) == (2, pytest.approx(2 / 3))
+
+
+class TestLoadExcel:
+    """Test cases for reading uploaded workbooks."""
+
+    @staticmethod
+    def workbook_bytes(df):
+        output = io.BytesIO()
+        df.to_excel(output, index=False, engine="openpyxl")
+        return output.getvalue()
+
+    def test_unknown_headers_keep_all_columns(self):
+        """Test that rows are kept when no header matches an alias."""
+        load_excel = load_app_function(
+            "load_excel", {'io': io, 'pd': pd, 'KNOWN_HEADERS': frozenset({'title', 'journal'})}
+        )
+
+        known = load_excel(self.workbook_bytes(pd.DataFrame({'Title': ['A'], 'Extra': ['x']})))
+        unknown = load_excel(self.workbook_bytes(pd.DataFrame({'Titre article': ['A', 'B'], 'Revue': ['J', 'K']})))
+
+        assert list(known.columns) == ['Title']
+        assert unknown.shape == (2, 2)
+        assert list(unknown['Titre article']) == ['A', 'B']
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,59 @@
+"""Tests for the pipeline orchestrator in the CLI module."""
+
+import pytest
+import pandas as pd
+from src.cli import LiteratureReviewPipeline
+
+
+class TestApplyScreeningDecisions:
+    """Test cases for applying screening decisions."""
+
+    def test_match_by_doi_then_id(self):
+        """Test that papers without a DOI are matched by their ID."""
+        df = pd.DataFrame({
+            'doi': ['10.1/a', None, '', '10.1/d'],
+            'id': ['W1', '12345', 'W3', 'W4'],
+            'title': ['A', 'B', 'C', 'D']
+        })
+        decisions = pd.DataFrame({
+            'paper_id': ['10.1/a', 12345, 'W3', 'W4'],
+            'decision': ['include', 'include', 'exclude', 'include'],
+            'notes': ['core', None, 'off-topic', 'maybe']
+        })
+        pipeline = LiteratureReviewPipeline()
+
+        included = pipeline.apply_screening_decisions(df, decisions)
+
+        # W4 has a DOI, so its ID is not used as the key
+        assert list(included['title']) == ['A', 'B']
+        assert list(included.columns) == ['doi', 'id', 'title', 'screening_notes']
+        assert included.loc[0, 'screening_notes'] == 'core'
+        assert pipeline.metrics['screening'] == {
+            'total_screened': 4,
+            'included_count': 2,
+            'excluded_count': 2
+        }
+
+    def test_load_included_papers_from_parquet(self, tmp_path):
+        """Test the filtered parquet read keeps the full screened count."""
+        df = pd.DataFrame({
+            'doi': ['10.1/a', None, '10.1/c'],
+            'id': ['W1', 'W2', 'W3'],
+            'title': ['A', 'B', 'C']
+        })
+        filepath = tmp_path / "processed_papers_1.parquet"
+        df.to_parquet(filepath, index=False)
+        decisions = pd.DataFrame({
+            'paper_id': ['10.1/c', 'W2'],
+            'decision': ['include', 'include']
+        })
+        pipeline = LiteratureReviewPipeline()
+
+        included = pipeline.load_included_papers(filepath, decisions)
+
+        assert list(included['title']) == ['B', 'C']
+        assert pipeline.metrics['screening']['total_screened'] == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
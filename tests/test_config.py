@@ -0,0 +1,36 @@
+"""Tests for the configuration module."""
+
+import json
+import logging
+import pytest
+from src.config import Config, JsonLogFormatter, config
+
+
+class TestConfig:
+    """Test cases for the Config class."""
+
+    def test_config_is_singleton(self):
+        """Test that every Config() call returns the shared instance."""
+        assert Config() is config
+        assert Config() is Config()
+
+
+class TestJsonLogFormatter:
+    """Test cases for JSON log formatting."""
+
+    def test_format_escapes_message(self):
+        """Test that quotes and newlines still produce valid JSON."""
+        record = logging.LogRecord(
+            "lit_review_pipeline", logging.INFO, __file__, 1,
+            'Loaded "%s"\nnext line', ("papers.csv",), None
+        )
+
+        entry = json.loads(JsonLogFormatter().format(record))
+
+        assert entry["message"] == 'Loaded "papers.csv"\nnext line'
+        assert entry["level"] == "INFO"
+        assert entry["module"] == "lit_review_pipeline"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -86,6 +86,20 @@ class TestDeduplicator:
         title2 = "machine learning applications"
         assert not deduplicator.are_titles_similar(title1, title2, 2020, 2023)
     
+    def test_find_fuzzy_duplicates_merges_groups(self):
+        """Test that chained title matches end up in a single group."""
+        df = pd.DataFrame([
+            {'title_normalized': 'machine learning for healthcare applications', 'year': 2020},
+            {'title_normalized': 'deep learning for finance', 'year': 2020},
+            {'title_normalized': 'machine learning for healthcare application', 'year': 2020},
+            {'title_normalized': 'machine learning for healthcare applications', 'year': 2021},
+        ])
+        
+        deduplicator = Deduplicator()
+        groups = deduplicator.find_fuzzy_duplicates(df)
+        
+        assert list(groups.values()) == [[0, 2, 3]]
+    
     def test_remove_exact_duplicates(self):
         """Test removing exact duplicates."""
         df = pd.DataFrame([
@@ -0,0 +1,191 @@
+"""Tests for the harvesting modules."""
+
+import pytest
+from unittest.mock import MagicMock
+from src.harvest import pubmed
+from src.harvest.crossref import CrossrefHarvester
+from src.harvest.openalex import OpenAlexHarvester
+from src.harvest.pubmed import PubMedHarvester, parse_efetch_xml
+
+
+class TestCrossrefParsing:
+    """Test cases for parsing Crossref works."""
+
+    def test_parse_works(self):
+        """Test field extraction and fallbacks across a page of works."""
+        works = [
+            {
+                'DOI': '10.1/a',
+                'title': ['Paper A'],
+                'author': [{'given': 'Ann', 'family': 'Lee'}, {'family': 'Kim'}, {'given': 'Solo'}],
+                'container-title': ['Journal A'],
+                'published-print': {'date-parts': [[2020, 1]]},
+                'is-referenced-by-count': 5
+            },
+            {
+                'DOI': '10.1/b',
+                'title': [],
+                'published-online': {'date-parts': [[2019]]}
+            },
+            {
+                'title': ['Paper C'],
+                'created': {'date-parts': [[2018, 2, 2]]},
+                'URL': 'http://example.org/c'
+            }
+        ]
+
+        df = CrossrefHarvester().parse_works(works)
+
+        assert list(df['authors']) == ['Lee, Ann; Kim', '', '']
+        assert list(df['title']) == ['Paper A', '', 'Paper C']
+        assert list(df['journal']) == ['Journal A', '', '']
+        assert list(df['year']) == [2020, 2019, 2018]
+        assert list(df['url']) == ['https://doi.org/10.1/a', 'https://doi.org/10.1/b', 'http://example.org/c']
+        assert list(df['cited_by']) == [5, 0, 0]
+
+
+class TestOpenAlexParsing:
+    """Test cases for parsing OpenAlex works."""
+
+    def test_parse_works(self):
+        """Test field extraction and fallbacks across a page of works."""
+        works = [
+            {
+                'id': 'https://openalex.org/W1',
+                'doi': 'https://doi.org/10.1/a',
+                'title': 'Paper A',
+                'authorships': [{'author': {'display_name': 'Ann Lee'}}, {'author': {}}],
+                'primary_location': {'source': {'display_name': 'Journal A'}},
+                'open_access': {'is_oa': True, 'oa_status': 'gold', 'oa_url': 'http://oa.org/a'},
+                'abstract_inverted_index': {'results': [1], 'Promising': [0], 'overall': [2]},
+                'publication_year': 2021
+            },
+            {
+                'id': 'https://openalex.org/W2',
+                'doi': None,
+                'title': 'Paper B',
+                'primary_location': {'source': None},
+                'open_access': {'is_oa': False, 'oa_url': None},
+                'best_oa_location': {'pdf_url': 'http://oa.org/b.pdf'},
+                'publication_year': 2020
+            }
+        ]
+
+        df = OpenAlexHarvester().parse_works(works)
+
+        assert list(df['doi']) == ['10.1/a', '']
+        assert list(df['authors']) == ['Ann Lee', '']
+        assert list(df['abstract']) == ['Promising results overall', '']
+        assert list(df['journal']) == ['Journal A', '']
+        assert list(df['url']) == ['https://doi.org/10.1/a', 'https://openalex.org/W2']
+        assert list(df['pdf_url']) == ['http://oa.org/a', 'http://oa.org/b.pdf']
+        assert list(df['oa_status']) == ['gold', 'closed']
+        assert list(df['cited_by']) == [0, 0]
+
+
+class TestPubMedParams:
+    """Test cases for building PubMed E-utilities query parameters."""
+
+    def test_params_use_history_server_and_api_key(self):
+        """Test history server parameters and the optional API key."""
+        harvester = PubMedHarvester()
+        harvester.api_key = ""
+
+        assert harvester.build_search_params('cbt', 2020, 2021)['usehistory'] == 'y'
+        assert 'api_key' not in harvester.build_fetch_params('MCID_1', '1', 200)
+
+        harvester.api_key = 'abc123'
+        fetch_params = harvester.build_fetch_params('MCID_1', '1', 200)
+
+        assert fetch_params['WebEnv'] == 'MCID_1'
+        assert fetch_params['query_key'] == '1'
+        assert (fetch_params['retstart'], fetch_params['retmax']) == (200, 500)
+        assert fetch_params['api_key'] == 'abc123'
+        assert harvester.build_search_params('cbt', 2020, 2021)['api_key'] == 'abc123'
+
+
+class TestPubMedParsing:
+    """Test cases for parsing PubMed EFetch XML."""
+
+    def test_parse_articles(self):
+        """Test streamed field extraction and fallbacks across a batch."""
+        content = """<?xml version="1.0" encoding="UTF-8"?>
+<PubmedArticleSet>
+  <PubmedArticle>
+    <MedlineCitation>
+      <PMID Version="1">111</PMID>
+      <Article>
+        <Journal>
+          <JournalIssue><PubDate><Year>2021</Year></PubDate></JournalIssue>
+          <Title>Journal A</Title>
+        </Journal>
+        <ArticleTitle>Effects of <i>in vivo</i> étude</ArticleTitle>
+        <Abstract>
+          <AbstractText Label="BACKGROUND">First part.</AbstractText>
+          <AbstractText Label="RESULTS">Second part.</AbstractText>
+        </Abstract>
+        <AuthorList>
+          <Author><LastName>Lee</LastName><ForeName>Ann</ForeName></Author>
+          <Author><LastName>Kim</LastName><Initials>J</Initials></Author>
+          <Author><CollectiveName>Group</CollectiveName></Author>
+        </AuthorList>
+        <ELocationID EIdType="pii">S1</ELocationID>
+        <ELocationID EIdType="doi">10.1/a</ELocationID>
+        <PublicationTypeList>
+          <PublicationType UI="D016454">Review</PublicationType>
+        </PublicationTypeList>
+      </Article>
+    </MedlineCitation>
+  </PubmedArticle>
+  <PubmedArticle>
+    <MedlineCitation>
+      <PMID Version="1">222</PMID>
+      <Article>
+        <Journal>
+          <JournalIssue><PubDate><MedlineDate>2019 Jan-Feb</MedlineDate></PubDate></JournalIssue>
+          <ISOAbbreviation>J B</ISOAbbreviation>
+        </Journal>
+        <ArticleTitle>Paper B</ArticleTitle>
+      </Article>
+    </MedlineCitation>
+  </PubmedArticle>
+</PubmedArticleSet>""".encode("utf-8")
+
+        raw_records, columns = parse_efetch_xml(content)
+
+        assert [record['pmid'] for record in raw_records] == ['111', '222']
+        assert '<PMID Version="1">222</PMID>' in raw_records[1]['xml']
+        assert columns['pmid'] == ['111', '222']
+        assert columns['title'] == ['Effects of in vivo étude', 'Paper B']
+        assert columns['abstract'] == ['First part. Second part.', '']
+        assert columns['authors'] == ['Lee, Ann; Kim, J', '']
+        assert columns['journal'] == ['Journal A', 'J B']
+        assert columns['year'] == [2021, 2019]
+        assert columns['doi'] == ['10.1/a', '']
+        assert columns['doc_type'] == ['review', 'journal-article']
+        assert columns['url'][1] == 'https://pubmed.ncbi.nlm.nih.gov/222/'
+
+
+class TestPubMedFetch:
+    """Test cases for fetching PubMed EFetch batches."""
+
+    def test_single_batch_parsed_inline(self, tmp_path, monkeypatch):
+        """Test that one batch is parsed without starting worker processes."""
+        content = (
+            '<PubmedArticleSet><PubmedArticle><MedlineCitation><PMID Version="1">111</PMID>'
+            '<Article><ArticleTitle>Paper A</ArticleTitle></Article>'
+            '</MedlineCitation></PubmedArticle></PubmedArticleSet>'
+        ).encode("utf-8")
+        monkeypatch.setattr(pubmed.config, "raw_dir", tmp_path)
+        monkeypatch.setattr(pubmed, "ProcessPoolExecutor", MagicMock(side_effect=AssertionError))
+        harvester = PubMedHarvester()
+        harvester.fetch_batch = MagicMock(return_value=content)
+
+        columns = harvester.fetch_articles('MCID_1', '1', 1)
+
+        assert columns['title'] == ['Paper A']
+        harvester.fetch_batch.assert_called_once_with('MCID_1', '1', 0, 1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
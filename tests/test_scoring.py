@@ -121,6 +121,17 @@ class TestQueryBasedScorer:
         assert len(predictions) == 0
         assert len(similarities) == 0
 
+    def test_score_papers_missing_abstract(self):
+        """Test scoring when the abstract column is absent."""
+        scorer = QueryBasedScorer("machine learning")
+
+        df = pd.DataFrame({'title': ['Machine learning', 'Cooking recipes']})
+        predictions, similarities = scorer.score_papers(df)
+
+        assert similarities[0] == 1.0
+        assert similarities[1] == 0.0
+        assert list(predictions) == [1, 0]
+
 
 class TestPaperScorer:
     """Test cases for the PaperScorer class."""
@@ -0,0 +1,215 @@
+"""Tests for the I/O utility module."""
+
+import os
+import time
+import pytest
+import pandas as pd
+import requests
+from src.utils_io import (
+    RequestPacer,
+    find_latest_file,
+    load_dataframe,
+    load_jsonl,
+    merge_dataframes,
+    optimize_dtypes,
+    parse_json_response,
+    save_dataframe,
+    save_jsonl,
+    write_jsonl
+)
+
+
+class TestMergeDataframes:
+    """Test cases for DataFrame merging."""
+
+    def test_merge_adds_source_column(self):
+        """Test source tagging and column alignment."""
+        df1 = pd.DataFrame({'title': ['A', 'B'], 'doi': ['10.1/a', '10.1/b']})
+        df2 = pd.DataFrame({'title': ['C'], 'year': [2020]})
+
+        merged = merge_dataframes([df1, df2], ['openalex', 'pubmed'])
+
+        assert len(merged) == 3
+        assert list(merged['source']) == ['openalex', 'openalex', 'pubmed']
+        assert set(merged.columns) == {'title', 'doi', 'year', 'source'}
+        assert pd.isna(merged.loc[2, 'doi'])
+        assert list(merged.index) == [0, 1, 2]
+
+    def test_merge_does_not_mutate_inputs(self):
+        """Test that input DataFrames are left unchanged."""
+        df1 = pd.DataFrame({'title': ['A']})
+        df2 = pd.DataFrame({'doi': ['10.1/b']})
+
+        merge_dataframes([df1, df2], ['crossref', 'pubmed'])
+
+        assert list(df1.columns) == ['title']
+        assert list(df2.columns) == ['doi']
+
+    def test_merge_keeps_existing_source(self):
+        """Test that an existing source column is preserved."""
+        df = pd.DataFrame({'title': ['A'], 'source': ['crossref']})
+
+        merged = merge_dataframes([df], ['openalex'])
+
+        assert merged.loc[0, 'source'] == 'crossref'
+
+        mixed = merge_dataframes([df, pd.DataFrame({'title': ['B']})], ['openalex', 'pubmed'])
+
+        assert list(mixed['source']) == ['crossref', 'pubmed']
+
+    def test_merge_projects_onto_columns(self):
+        """Test projection onto a canonical column list."""
+        df1 = pd.DataFrame({'title': ['A'], 'extra': ['x']})
+        df2 = pd.DataFrame({'doi': ['10.1/b'], 'title': ['B']})
+
+        merged = merge_dataframes(
+            [df1, df2], ['openalex', 'pubmed'], columns=['source', 'title', 'doi']
+        )
+
+        assert list(merged.columns) == ['source', 'title', 'doi']
+        assert list(merged['title']) == ['A', 'B']
+        assert pd.isna(merged.loc[0, 'doi'])
+
+    def test_merge_empty_inputs(self):
+        """Test merging with no or only empty DataFrames."""
+        assert merge_dataframes([]).empty
+        assert merge_dataframes([pd.DataFrame(), pd.DataFrame()]).empty
+
+
+class TestDataframeIO:
+    """Test cases for DataFrame save/load helpers."""
+
+    def test_parquet_roundtrip_with_columns(self, tmp_path):
+        """Test parquet save/load, including column projection."""
+        df = pd.DataFrame({
+            'title': ['A', 'B'],
+            'year': [2020, 2021],
+            'abstract': ['x', 'y']
+        })
+        filepath = tmp_path / "papers.parquet"
+
+        save_dataframe(df, filepath)
+        loaded = load_dataframe(filepath)
+        assert loaded.equals(df)
+
+        subset = load_dataframe(filepath, columns=['title', 'year', 'missing'])
+        assert list(subset.columns) == ['title', 'year']
+
+    def test_csv_load_with_columns(self, tmp_path):
+        """Test CSV column projection ignoring absent columns."""
+        filepath = tmp_path / "papers.csv"
+        save_dataframe(pd.DataFrame({'title': ['A'], 'abstract': ['x'], 'doi': ['10.1/a']}), filepath)
+
+        loaded = load_dataframe(filepath, columns=['doi', 'title', 'missing'])
+
+        assert list(loaded.columns) == ['title', 'doi']
+
+    def test_jsonl_append_roundtrip(self, tmp_path):
+        """Test JSON Lines writing in append mode."""
+        filepath = tmp_path / "raw.jsonl"
+
+        save_jsonl([{'id': 1}, {'id': 2, 'title': 'Étude'}], filepath)
+        save_jsonl([{'id': 3}], filepath, append=True)
+
+        assert load_jsonl(filepath) == [{'id': 1}, {'id': 2, 'title': 'Étude'}, {'id': 3}]
+
+    def test_gzip_jsonl_append_roundtrip(self, tmp_path):
+        """Test compressed JSON Lines, appended across several writes."""
+        filepath = tmp_path / "raw.jsonl.gz"
+
+        save_jsonl([{'id': 1, 'title': 'Étude'}], filepath, append=True)
+        save_jsonl([{'id': 2}], filepath, append=True)
+
+        assert filepath.read_bytes()[:2] == b'\x1f\x8b'
+        assert load_jsonl(filepath) == [{'id': 1, 'title': 'Étude'}, {'id': 2}]
+
+    def test_write_jsonl_to_open_file(self, tmp_path):
+        """Test writing several batches through one open handle."""
+        filepath = tmp_path / "raw.jsonl"
+
+        with open(filepath, "a", encoding="utf-8") as f:
+            write_jsonl([{'id': 1}], f)
+            write_jsonl([{'id': 2}, {'id': 3}], f)
+
+        assert load_jsonl(filepath) == [{'id': 1}, {'id': 2}, {'id': 3}]
+
+    def test_parse_json_response(self):
+        """Test decoding a JSON response body."""
+        response = requests.Response()
+        response._content = '{"results": [{"title": "Étude"}], "count": 1}'.encode("utf-8")
+
+        assert parse_json_response(response) == {'results': [{'title': 'Étude'}], 'count': 1}
+
+    def test_find_latest_file(self, tmp_path):
+        """Test newest stage file lookup across Parquet and CSV outputs."""
+        assert find_latest_file(tmp_path, "processed_papers_") is None
+        assert find_latest_file(tmp_path / "missing", "processed_papers_") is None
+
+        old_csv = tmp_path / "processed_papers_1.csv"
+        new_parquet = tmp_path / "processed_papers_2.parquet"
+        other = tmp_path / "combined_harvest_3.parquet"
+        for i, path in enumerate([old_csv, new_parquet, other]):
+            path.write_text("")
+            os.utime(path, (i, i))
+
+        assert find_latest_file(tmp_path, "processed_papers_") == new_parquet
+
+    def test_unsupported_format(self, tmp_path):
+        """Test that unknown formats raise ValueError."""
+        with pytest.raises(ValueError):
+            save_dataframe(pd.DataFrame({'a': [1]}), tmp_path / "data.txt")
+
+
+class TestOptimizeDtypes:
+    """Test cases for dtype optimization."""
+
+    def test_optimize_dtypes(self):
+        """Test categorical conversion and integer downcasting."""
+        df = pd.DataFrame({
+            'source': ['openalex', 'pubmed', 'openalex'],
+            'year': [2020, 2021, 2022],
+            'cited_by': [1.0, None, 3.0],
+            'title': ['A', None, 'C']
+        })
+
+        optimized = optimize_dtypes(
+            df,
+            category_columns=['source', 'missing'],
+            integer_columns=['year', 'cited_by'],
+            string_columns=['title']
+        )
+
+        assert isinstance(optimized['source'].dtype, pd.CategoricalDtype)
+        assert optimized['year'].dtype == 'int16'
+        assert optimized['cited_by'].dtype == 'float64'
+        assert df['source'].dtype == object
+        assert list(optimized['source']) == list(df['source'])
+        assert optimized['title'].dtype == 'string[pyarrow]'
+        assert optimized['title'].isna().tolist() == [False, True, False]
+
+
+class TestRequestPacer:
+    """Test cases for request pacing."""
+
+    def test_reserve_spaces_slots(self):
+        """Test that consecutive reservations are one interval apart."""
+        pacer = RequestPacer(rate_limit=10)
+
+        delays = [pacer.reserve() for _ in range(3)]
+
+        assert delays[0] == 0.0
+        assert delays[1] == pytest.approx(0.1, abs=0.01)
+        assert delays[2] == pytest.approx(0.2, abs=0.01)
+
+    def test_reserve_after_slow_request(self):
+        """Test that time already elapsed counts towards the interval."""
+        pacer = RequestPacer(rate_limit=100)
+
+        pacer.reserve()
+        time.sleep(0.02)
+
+        assert pacer.reserve() == 0.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])